@@ -15,7 +15,6 @@ from datetime import datetime, timezone
 import asyncio
 import copy
 import inspect
-import json
 import time
 
 from typing import (
@@ -41,7 +40,7 @@ from SimpleLLMFunc.type import (
     ToolResult,
 )
 from SimpleLLMFunc.logger import app_log, push_debug
-from SimpleLLMFunc.logger.logger import get_current_context_attribute, get_location
+from SimpleLLMFunc.logger.logger import get_current_context_attribute
 from SimpleLLMFunc.logger.context_manager import get_current_trace_id
 from SimpleLLMFunc.hooks.event_bus import EventBus
 from SimpleLLMFunc.hooks.abort import AbortSignal
@@ -75,12 +74,12 @@ from SimpleLLMFunc.base.post_process import (
     extract_content_from_stream_response,
 )
 from SimpleLLMFunc.base.tool_call import (
-    accumulate_tool_calls_from_chunks,
+    ToolCallAccumulator,
+    _execute_single_tool_call,
     extract_reasoning_details,
     extract_reasoning_details_from_stream,
     parse_tool_call_arguments,
     extract_tool_calls,
-    extract_tool_calls_from_stream_response,
     process_tool_calls,
 )
 from SimpleLLMFunc.base.react_hooks import ReActState, run_react_hook
@@ -90,6 +89,7 @@ from SimpleLLMFunc.observability.langfuse_client import (
     get_langfuse_trace_context,
     langfuse_client,
 )
+from SimpleLLMFunc.utils import json_utils
 
 
 async def _yield_pending_event_bus_events(
@@ -295,7 +295,7 @@ class _StreamingToolCallState:
 def _stringify_argument_value(value: Any) -> str:
     if isinstance(value, str):
         return value
-    return json.dumps(value, ensure_ascii=False, default=str)
+    return json_utils.dumps(value, default=str)
 
 
 def _collect_stream_argument_deltas(
@@ -423,10 +423,6 @@ async def _process_tool_calls_with_events_gen(
 
     trace_context = get_langfuse_trace_context()
 
-    # 准备执行环境
-    from SimpleLLMFunc.base.tool_call.execution import _execute_single_tool_call
-    import asyncio
-
     fallback_event_queue: asyncio.Queue[EventYield] = asyncio.Queue()
 
     async def _publish_tool_event(
@@ -546,7 +542,7 @@ async def _process_tool_calls_with_events_gen(
                 if tool_message.get("role") == "tool":
                     content = tool_message.get("content", "")
                     try:
-                        parsed = json.loads(content)
+                        parsed = json_utils.loads(content)
                         tool_result = (
                             parsed if isinstance(parsed, (str, dict, list)) else content
                         )
@@ -560,7 +556,7 @@ async def _process_tool_calls_with_events_gen(
                 {
                     "role": "tool",
                     "tool_call_id": tool_call_id,
-                    "content": json.dumps({"error": str(e)}, ensure_ascii=False),
+                    "content": json_utils.dumps({"error": str(e)}),
                 }
             ]
             is_multimodal = False
@@ -896,15 +892,19 @@ async def _stream_single_llm_call_outputs(
 
     content = ""
     tool_calls: List[Dict[str, Any]] = []
-    tool_call_chunks: List[Dict[str, Any]] = []
     reasoning_details: List[Dict[str, Any]] = []
     last_response: Any = None
     usage_info: Optional[CompletionUsage] = None
     aborted = False
 
+    # 单次 LLM 调用期间 messages 不会变化，所有 ResponseYield 共享同一份快照，
+    # 避免流式输出时每个 chunk 都复制一次完整的消息列表
+    messages_snapshot = messages.copy()
+
     if stream:
         reasoning_details_list: List[Dict[str, Any]] = []
         stream_tool_call_states: Dict[int, _StreamingToolCallState] = {}
+        tool_call_accumulator = ToolCallAccumulator()
         chunk_index = 0
         accumulated_content = ""
         stream_response = llm_interface.chat_stream(
@@ -923,11 +923,12 @@ async def _stream_single_llm_call_outputs(
                 await _close_stream(stream_response)
                 break
 
-            chunk_content = extract_content_from_stream_response(chunk, func_name)
-            content += chunk_content
-            accumulated_content += chunk_content
-            chunk_tool_call_chunks = extract_tool_calls_from_stream_response(chunk)
-            tool_call_chunks.extend(chunk_tool_call_chunks)
+            # 每个 chunk 事件都需要一份完整的累计文本，最终 content 直接复用它，
+            # 不再并行维护第二份同样的字符串拼接
+            accumulated_content += extract_content_from_stream_response(
+                chunk, func_name
+            )
+            chunk_tool_call_chunks = tool_call_accumulator.feed(chunk)
             reasoning_details_list.extend(extract_reasoning_details_from_stream(chunk))  # type: ignore[arg-type]
             last_response = chunk
 
@@ -972,7 +973,7 @@ async def _stream_single_llm_call_outputs(
             yield ResponseYield(
                 type="response",
                 response=chunk,
-                messages=messages.copy(),
+                messages=messages_snapshot,
             )
 
             if _abort_requested():
@@ -980,7 +981,8 @@ async def _stream_single_llm_call_outputs(
                 await _close_stream(stream_response)
                 break
 
-        tool_calls = accumulate_tool_calls_from_chunks(tool_call_chunks)
+        content = accumulated_content
+        tool_calls = tool_call_accumulator.build()
         reasoning_details = reasoning_details_list
     else:
         if _abort_requested():
@@ -999,7 +1001,7 @@ async def _stream_single_llm_call_outputs(
             yield ResponseYield(
                 type="response",
                 response=response,
-                messages=messages.copy(),
+                messages=messages_snapshot,
             )
 
     usage_info = extract_usage_from_response(last_response)
@@ -1603,9 +1605,19 @@ async def execute_llm(
             result.usage = source_phase.usage
         return result
 
+    def _log_phase_summary(phase: _LLMPhaseResult, *, iteration: int) -> None:
+        # 每次 LLM 调用只记录一条带结构化字段的调试日志
+        push_debug(
+            f"LLM 函数 '{func_name}' 第 {iteration} 轮响应已获取，"
+            f"工具调用数: {len(phase.tool_calls)}",
+            iteration=iteration,
+            content_len=len(phase.content),
+            tool_calls_count=len(phase.tool_calls),
+            message_count=len(phase.messages),
+        )
+
     push_debug(
         f"LLM 函数 '{func_name}' 开始执行，消息数: {len(current_messages)}",
-        location=get_location(),
     )
 
     await run_react_hook(hooks, "on_run_start", state)
@@ -1644,12 +1656,9 @@ async def execute_llm(
         yield output
 
     current_messages = initial_phase.messages
-    push_debug(
-        f"LLM 函数 '{func_name}' 初始响应已获取，工具调用数: {len(initial_phase.tool_calls)}",
-        location=get_location(),
-    )
     _append_assistant_response_if_present(initial_phase)
     current_messages = initial_phase.messages
+    _log_phase_summary(initial_phase, iteration=0)
 
     if initial_phase.aborted:
         async for output in _finalize_terminal_phase(
@@ -1659,7 +1668,7 @@ async def execute_llm(
             aborted=True,
         ):
             yield output
-        app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+        app_log(f"LLM 函数 '{func_name}' aborted")
         return
 
     if not initial_phase.tool_calls:
@@ -1670,7 +1679,7 @@ async def execute_llm(
             aborted=False,
         ):
             yield output
-        app_log(f"LLM 函数 '{func_name}' 完成执行", location=get_location())
+        app_log(f"LLM 函数 '{func_name}' 完成执行")
         return
 
     _append_assistant_tool_message(initial_phase)
@@ -1680,10 +1689,6 @@ async def execute_llm(
     ):
         yield output
 
-    push_debug(
-        f"LLM 函数 '{func_name}' 开始执行 {len(initial_phase.tool_calls)} 个工具调用",
-        location=get_location(),
-    )
     total_tool_calls += len(initial_phase.tool_calls)
     state.total_tool_calls = total_tool_calls
     call_count = 1
@@ -1711,7 +1716,7 @@ async def execute_llm(
             aborted=True,
         ):
             yield output
-        app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+        app_log(f"LLM 函数 '{func_name}' aborted")
         return
 
     while True:
@@ -1723,10 +1728,6 @@ async def execute_llm(
         if iteration_start is not None:
             yield iteration_start
 
-        push_debug(
-            f"LLM 函数 '{func_name}' 工具调用循环 (次数: {call_count})",
-            location=get_location(),
-        )
         iteration_llm_start_time = time.time()
 
         iteration_phase = _LLMPhaseResult(messages=current_messages)
@@ -1748,6 +1749,7 @@ async def execute_llm(
         current_messages = iteration_phase.messages
         _append_assistant_response_if_present(iteration_phase)
         current_messages = iteration_phase.messages
+        _log_phase_summary(iteration_phase, iteration=iteration)
 
         if iteration_phase.aborted:
             async for output in _finalize_terminal_phase(
@@ -1757,14 +1759,10 @@ async def execute_llm(
                 aborted=True,
             ):
                 yield output
-            app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+            app_log(f"LLM 函数 '{func_name}' aborted")
             return
 
         if not iteration_phase.tool_calls:
-            push_debug(
-                f"LLM 函数 '{func_name}' 无更多工具调用，返回最终结果",
-                location=get_location(),
-            )
             iteration_end = await _emit_iteration_end_event(
                 iteration,
                 current_messages,
@@ -1781,7 +1779,7 @@ async def execute_llm(
                 aborted=False,
             ):
                 yield output
-            app_log(f"LLM 函数 '{func_name}' 完成执行", location=get_location())
+            app_log(f"LLM 函数 '{func_name}' 完成执行")
             return
 
         _append_assistant_tool_message(iteration_phase)
@@ -1792,10 +1790,6 @@ async def execute_llm(
         ):
             yield output
 
-        push_debug(
-            f"LLM 函数 '{func_name}' 发现 {len(iteration_phase.tool_calls)} 个工具调用",
-            location=get_location(),
-        )
         total_tool_calls += len(iteration_phase.tool_calls)
         state.total_tool_calls = total_tool_calls
 
@@ -1820,7 +1814,7 @@ async def execute_llm(
                 aborted=True,
             ):
                 yield output
-            app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+            app_log(f"LLM 函数 '{func_name}' aborted")
             return
 
         iteration_end = await _emit_iteration_end_event(
@@ -1837,7 +1831,6 @@ async def execute_llm(
 
     push_debug(
         f"LLM 函数 '{func_name}' 达到最大工具调用次数限制 ({max_tool_calls})",
-        location=get_location(),
     )
 
     if _abort_requested():
@@ -1851,7 +1844,7 @@ async def execute_llm(
             aborted=True,
         ):
             yield output
-        app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+        app_log(f"LLM 函数 '{func_name}' aborted")
         return
 
     final_phase = _LLMPhaseResult(messages=current_messages)
@@ -1882,7 +1875,7 @@ async def execute_llm(
             aborted=True,
         ):
             yield output
-        app_log(f"LLM 函数 '{func_name}' aborted", location=get_location())
+        app_log(f"LLM 函数 '{func_name}' aborted")
         return
 
     async for output in _finalize_terminal_phase(
@@ -1892,7 +1885,7 @@ async def execute_llm(
         aborted=False,
     ):
         yield output
-    app_log(f"LLM 函数 '{func_name}' 完成执行", location=get_location())
+    app_log(f"LLM 函数 '{func_name}' 完成执行")
 
 
 __all__ = ["execute_llm", "execute_single_llm_call"]
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import UnionType
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
 
 from SimpleLLMFunc.logger import push_debug, push_error, push_warning
 from SimpleLLMFunc.logger.logger import get_location
 from SimpleLLMFunc.type.multimodal import ImgPath, ImgUrl, Text
 
+_MM_TYPES_STR = (Text, ImgUrl, ImgPath, str)
+_TEXT_TYPES = (Text, str)
+_SEQ_TYPES = (list, tuple)
+
 
 def handle_union_type(value: Any, args: tuple, param_name: str) -> List[Dict[str, Any]]:
     """Handle Union annotations containing multimodal payload combinations."""
 
     content: List[Dict[str, Any]] = []
 
-    if isinstance(value, (Text, ImgUrl, ImgPath, str)):
-        if isinstance(value, (Text, str)):
+    if isinstance(value, _MM_TYPES_STR):
+        if isinstance(value, _TEXT_TYPES):
             content.append(create_text_content(value, param_name))
         elif isinstance(value, ImgUrl):
             content.append(create_image_url_content(value, param_name))
@@ -23,10 +28,10 @@ def handle_union_type(value: Any, args: tuple, param_name: str) -> List[Dict[str
             content.append(create_image_path_content(value, param_name))
         return content
 
-    if isinstance(value, (list, tuple)):
+    if isinstance(value, _SEQ_TYPES):
         for i, item in enumerate(value):
-            if isinstance(item, (Text, ImgUrl, ImgPath, str)):
-                if isinstance(item, (Text, str)):
+            if isinstance(item, _MM_TYPES_STR):
+                if isinstance(item, _TEXT_TYPES):
                     content.append(create_text_content(item, f"{param_name}[{i}]"))
                 elif isinstance(item, ImgUrl):
                     content.append(create_image_url_content(item, f"{param_name}[{i}]"))
@@ -74,19 +79,17 @@ def parse_multimodal_parameter(
 ) -> List[Dict[str, Any]]:
     """Recursively parse annotated parameters into OpenAI content payloads."""
 
-    from typing import List as TypingList, Union, get_args, get_origin
-
     if value is None:
         return []
 
     origin = get_origin(annotation)
     args = get_args(annotation)
 
-    if origin is Union:
+    if origin is Union or origin is UnionType:
         return handle_union_type(value, args, param_name)
 
-    if origin in (list, TypingList):
-        if not isinstance(value, (list, tuple)):
+    if origin is list:
+        if not isinstance(value, _SEQ_TYPES):
             push_warning(
                 f"参数 {param_name} 应为列表类型，但获得 {type(value)}",
                 location=get_location(),
@@ -102,7 +105,7 @@ def parse_multimodal_parameter(
 
         element_type = args[0]
 
-        if element_type not in (Text, ImgUrl, ImgPath, str):
+        if element_type not in _MM_TYPES_STR:
             push_error(
                 f"参数 {param_name} 的List类型必须直接包裹基础类型（Text, ImgUrl, ImgPath, str），但获得 {element_type}",
                 location=get_location(),
@@ -117,7 +120,7 @@ def parse_multimodal_parameter(
             content.extend(item_content)
         return content
 
-    if annotation in (Text, str):
+    if annotation in _TEXT_TYPES:
         return [create_text_content(value, param_name)]
     if annotation is ImgUrl:
         return [create_image_url_content(value, param_name)]
@@ -176,9 +179,7 @@ def create_image_path_content(value: Any, param_name: str) -> Dict[str, Any]:
         img_path = ImgPath(value)
         detail = "auto"
 
-    base64_img = img_path.to_base64()
-    mime_type = img_path.get_mime_type()
-    data_url = f"data:{mime_type};base64,{base64_img}"
+    data_url = img_path.to_data_url()
 
     push_debug(
         f"添加本地图片: {param_name} = {img_path.path} (detail: {detail})",
@@ -3,14 +3,17 @@
 from SimpleLLMFunc.base.tool_call.execution import (
     _execute_single_tool_call,
     process_tool_calls,
+    process_tool_calls_streaming,
 )
 from SimpleLLMFunc.base.tool_call.extraction import (
     AccumulatedToolCall,
+    ToolCallAccumulator,
     ToolCallFunctionInfo,
     accumulate_tool_calls_from_chunks,
     extract_reasoning_details,
     extract_reasoning_details_from_stream,
     parse_tool_call_arguments,
+    repair_and_parse_tool_call_arguments,
     repair_tool_call_arguments,
     extract_tool_calls,
     extract_tool_calls_from_stream_response,
@@ -27,10 +30,13 @@ __all__ = [
     "serialize_tool_output_for_langfuse",
     "is_valid_tool_result",
     "process_tool_calls",
+    "process_tool_calls_streaming",
     "extract_tool_calls",
     "accumulate_tool_calls_from_chunks",
+    "ToolCallAccumulator",
     "parse_tool_call_arguments",
     "repair_tool_call_arguments",
+    "repair_and_parse_tool_call_arguments",
     "extract_tool_calls_from_stream_response",
     "extract_reasoning_details",
     "extract_reasoning_details_from_stream",
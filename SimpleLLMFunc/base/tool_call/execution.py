@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import json
+import weakref
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     List,
+    NamedTuple,
     Optional,
     get_type_hints,
     get_origin,
@@ -18,21 +20,91 @@ from typing import (
     Union as TypingUnion,
 )
 
-from SimpleLLMFunc.logger import push_debug, push_error, push_warning
-from SimpleLLMFunc.logger.logger import get_location
+from SimpleLLMFunc.logger import (
+    is_debug_enabled,
+    push_debug,
+    push_error,
+    push_warning,
+)
 from SimpleLLMFunc.type.multimodal import ImgPath, ImgUrl, Text
 from SimpleLLMFunc.hooks.abort import AbortSignal
+from SimpleLLMFunc.utils import json_utils
 from SimpleLLMFunc.observability.langfuse_client import (
     coerce_langfuse_metadata,
     get_langfuse_trace_context,
     langfuse_client,
 )
 from SimpleLLMFunc.base.tool_call.extraction import (
-    parse_tool_call_arguments,
-    repair_tool_call_arguments,
+    repair_and_parse_tool_call_arguments,
+)
+from SimpleLLMFunc.base.tool_call.validation import (
+    is_valid_tool_result,
+    serialize_tool_output_for_langfuse,
+)
+
+
+# 需要从 LLM 传来的字符串转换为多模态对象的参数类型
+_MULTIMODAL_ARGUMENT_TYPES = (ImgPath, ImgUrl, Text)
+
+
+_MultimodalPlan = Dict[str, tuple[type, bool]]
+
+# 签名和类型注解在工具的生命周期内不会变化，按函数缓存；弱引用不会延长工具函数的生命周期
+_MULTIMODAL_PLAN_CACHE: "weakref.WeakKeyDictionary[Callable, _MultimodalPlan]" = (
+    weakref.WeakKeyDictionary()
 )
 
 
+def _resolve_multimodal_parameters(
+    tool_func: Callable[..., Awaitable[Any]],
+) -> _MultimodalPlan:
+    """解析工具函数中需要多模态转换的参数，结果按函数缓存。
+
+    Returns:
+        参数名到 (多模态类型, 是否为列表) 的映射，不需要转换的参数不会出现在其中
+    """
+    try:
+        return _MULTIMODAL_PLAN_CACHE[tool_func]
+    except KeyError:
+        pass
+    except TypeError:
+        # 不可哈希或不支持弱引用的可调用对象不缓存
+        return _inspect_multimodal_parameters(tool_func)
+
+    plan = _inspect_multimodal_parameters(tool_func)
+    _MULTIMODAL_PLAN_CACHE[tool_func] = plan
+    return plan
+
+
+def _inspect_multimodal_parameters(
+    tool_func: Callable[..., Awaitable[Any]],
+) -> _MultimodalPlan:
+    """解析工具函数的签名与类型注解，找出需要多模态转换的参数"""
+    signature = inspect.signature(tool_func)
+    type_hints = get_type_hints(tool_func)
+
+    plan: _MultimodalPlan = {}
+    for param_name in signature.parameters:
+        param_type = type_hints.get(param_name, Any)
+
+        # 处理 Optional 类型：提取非 None 类型
+        origin = get_origin(param_type)
+        if origin is TypingUnion:
+            non_none_types = [t for t in get_args(param_type) if t is not type(None)]
+            if non_none_types:
+                param_type = non_none_types[0]
+                origin = get_origin(param_type)
+
+        if origin is list:
+            args = get_args(param_type)
+            if args and args[0] in _MULTIMODAL_ARGUMENT_TYPES:
+                plan[param_name] = (args[0], True)
+        elif param_type in _MULTIMODAL_ARGUMENT_TYPES:
+            plan[param_name] = (param_type, False)
+
+    return plan
+
+
 def _convert_tool_arguments(
     arguments: Dict[str, Any],
     tool_func: Callable[..., Awaitable[Any]],
@@ -55,139 +127,127 @@ def _convert_tool_arguments(
         转换后的参数字典
     """
     try:
-        # 获取函数签名和类型注解
-        signature = inspect.signature(tool_func)
-        type_hints = get_type_hints(tool_func)
+        plan = _resolve_multimodal_parameters(tool_func)
+    except Exception as e:
+        push_warning(f"工具参数转换过程中出错: {e}，使用原始参数")
+        return arguments
 
-        converted_args = {}
+    converted_args = dict(arguments)
+    for param_name, (target_type, is_list) in plan.items():
+        param_value = arguments.get(param_name)
 
-        for param_name, param_value in arguments.items():
-            if param_name not in signature.parameters:
-                # 参数不在签名中，保持原样
-                converted_args[param_name] = param_value
+        # None、缺失的参数以及类型不匹配的值保持原样
+        if is_list:
+            if not isinstance(param_value, list):
                 continue
-
-            param_type = type_hints.get(param_name, Any)
-
-            # 处理 None 值
-            if param_value is None:
-                converted_args[param_name] = None
+            type_label = f"List[{target_type.__name__}]"
+        else:
+            if not isinstance(param_value, str):
                 continue
+            type_label = target_type.__name__
 
-            # 处理 Optional 类型
-            origin = get_origin(param_type)
-            if origin is TypingUnion:
-                args = get_args(param_type)
-                # 提取非 None 类型
-                non_none_types = [t for t in args if t is not type(None)]
-                if non_none_types:
-                    param_type = non_none_types[0]
-                    origin = get_origin(param_type)
-
-            # 处理列表类型
-            if origin is list:
-                args = get_args(param_type)
-                if not args:
-                    # List 没有类型参数，保持原样
-                    converted_args[param_name] = param_value
-                    continue
-
-                element_type = args[0]
-
-                # 检查是否为多模态列表类型
-                if element_type is ImgPath:
-                    if isinstance(param_value, list):
-                        try:
-                            converted_args[param_name] = [
-                                ImgPath(path) for path in param_value
-                            ]
-                        except Exception as e:
-                            push_warning(
-                                f"工具参数 '{param_name}' 转换为 List[ImgPath] 失败: {e}，使用原始值",
-                                location=get_location(),
-                            )
-                            converted_args[param_name] = param_value
-                    else:
-                        converted_args[param_name] = param_value
-                elif element_type is ImgUrl:
-                    if isinstance(param_value, list):
-                        try:
-                            converted_args[param_name] = [
-                                ImgUrl(url) for url in param_value
-                            ]
-                        except Exception as e:
-                            push_warning(
-                                f"工具参数 '{param_name}' 转换为 List[ImgUrl] 失败: {e}，使用原始值",
-                                location=get_location(),
-                            )
-                            converted_args[param_name] = param_value
-                    else:
-                        converted_args[param_name] = param_value
-                elif element_type is Text:
-                    if isinstance(param_value, list):
-                        try:
-                            converted_args[param_name] = [
-                                Text(text) for text in param_value
-                            ]
-                        except Exception as e:
-                            push_warning(
-                                f"工具参数 '{param_name}' 转换为 List[Text] 失败: {e}，使用原始值",
-                                location=get_location(),
-                            )
-                            converted_args[param_name] = param_value
-                    else:
-                        converted_args[param_name] = param_value
-                else:
-                    # 非多模态列表，保持原样
-                    converted_args[param_name] = param_value
-            # 处理单个多模态类型
-            elif param_type is ImgPath:
-                if isinstance(param_value, str):
-                    try:
-                        converted_args[param_name] = ImgPath(param_value)
-                    except Exception as e:
-                        push_warning(
-                            f"工具参数 '{param_name}' 转换为 ImgPath 失败: {e}，使用原始值",
-                            location=get_location(),
-                        )
-                        converted_args[param_name] = param_value
-                else:
-                    converted_args[param_name] = param_value
-            elif param_type is ImgUrl:
-                if isinstance(param_value, str):
-                    try:
-                        converted_args[param_name] = ImgUrl(param_value)
-                    except Exception as e:
-                        push_warning(
-                            f"工具参数 '{param_name}' 转换为 ImgUrl 失败: {e}，使用原始值",
-                            location=get_location(),
-                        )
-                        converted_args[param_name] = param_value
-                else:
-                    converted_args[param_name] = param_value
-            elif param_type is Text:
-                if isinstance(param_value, str):
-                    try:
-                        converted_args[param_name] = Text(param_value)
-                    except Exception as e:
-                        push_warning(
-                            f"工具参数 '{param_name}' 转换为 Text 失败: {e}，使用原始值",
-                            location=get_location(),
-                        )
-                        converted_args[param_name] = param_value
-                else:
-                    converted_args[param_name] = param_value
+        try:
+            if is_list:
+                converted_args[param_name] = [
+                    target_type(item) for item in param_value
+                ]
             else:
-                # 其他类型，保持原样
-                converted_args[param_name] = param_value
+                converted_args[param_name] = target_type(param_value)
+        except Exception as e:
+            push_warning(
+                f"工具参数 '{param_name}' 转换为 {type_label} 失败: {e}，使用原始值",
+            )
 
-        return converted_args
-    except Exception as e:
-        push_warning(
-            f"工具参数转换过程中出错: {e}，使用原始参数",
-            location=get_location(),
-        )
-        return arguments
+    return converted_args
+
+
+def _image_url_content(image: ImgUrl) -> Dict[str, Any]:
+    return {
+        "type": "image_url",
+        "image_url": {"url": image.url, "detail": image.detail},
+    }
+
+
+def _image_path_content(image: ImgPath) -> Dict[str, Any]:
+    return {
+        "type": "image_url",
+        "image_url": {"url": image.to_data_url(), "detail": image.detail},
+    }
+
+
+class _ImageResult(NamedTuple):
+    """An image tool result classified by a single structural match."""
+
+    text: Optional[str]
+    image: TypingUnion[ImgUrl, ImgPath]
+    build_content: Callable[[Any], Dict[str, Any]]
+    label: str
+    is_path: bool
+
+
+def _match_image_result(tool_result: Any) -> Optional[_ImageResult]:
+    """Classify an ImgUrl/ImgPath result or (str, image) tuple; None otherwise.
+
+    每个分支直接绑定图像、内容构造函数和说明文字，结果只做一次模式匹配。
+    序列模式也会匹配 list，这里只接受元组。
+    """
+    match tool_result:
+        case ImgUrl():
+            return _ImageResult(
+                None, tool_result, _image_url_content, "返回的图像", False
+            )
+        case ImgPath():
+            return _ImageResult(
+                None, tool_result, _image_path_content, "返回的图像文件", True
+            )
+        case (str() as text, ImgUrl() as image) if isinstance(tool_result, tuple):
+            return _ImageResult(
+                text, image, _image_url_content, "返回的图像和说明", False
+            )
+        case (str() as text, ImgPath() as image) if isinstance(tool_result, tuple):
+            return _ImageResult(
+                text, image, _image_path_content, "返回的图像文件和说明", True
+            )
+    return None
+
+
+def _image_result_message(tool_name: str, result: _ImageResult) -> Dict[str, Any]:
+    """Build the user message carrying an already classified image result."""
+    if result.text is None:
+        text = f"这是工具 '{tool_name}' {result.label}："
+    else:
+        text = f"这是工具 '{tool_name}' {result.label}：{result.text}"
+
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": text},
+            result.build_content(result.image),
+        ],
+    }
+
+
+def _build_multimodal_result_message(
+    tool_name: str, tool_result: Any
+) -> Optional[Dict[str, Any]]:
+    """Build the user message for an image tool result.
+
+    支持 ImgUrl、ImgPath 以及 (str, ImgUrl)/(str, ImgPath) 元组，普通结果返回 None。
+    """
+    result = _match_image_result(tool_result)
+    if result is None:
+        return None
+    return _image_result_message(tool_name, result)
+
+
+def _tool_message(tool_call_id: Optional[str], content: str) -> Dict[str, Any]:
+    """Build a tool role message carrying already-encoded JSON content."""
+    return {"role": "tool", "tool_call_id": tool_call_id, "content": content}
+
+
+def _tool_error_message(tool_call_id: Optional[str], error: str) -> Dict[str, Any]:
+    """Build a tool role message reporting an error to the model."""
+    return _tool_message(tool_call_id, json_utils.dumps({"error": error}))
 
 
 async def _execute_single_tool_call(
@@ -217,21 +277,18 @@ async def _execute_single_tool_call(
     """
 
     tool_call_id = tool_call.get("id")
-    function_call = tool_call.get("function", {})
+    # 只有缺少 function 字段时才创建空字典，不必每次调用都构造默认值
+    function_call = tool_call.get("function") or {}
     tool_name = function_call.get("name")
     arguments_str = function_call.get("arguments", "{}")
     messages_to_append: List[Dict[str, Any]] = []
 
-    if tool_name not in tool_map:
+    tool_func = tool_map.get(tool_name) if tool_name is not None else None
+    if tool_func is None:
         push_error(f"工具 '{tool_name}' 不在可用工具列表中")
-        tool_error_message = {
-            "role": "tool",
-            "tool_call_id": tool_call_id,
-            "content": json.dumps(
-                {"error": f"找不到工具 '{tool_name}'"}, ensure_ascii=False, indent=2
-            ),
-        }
-        messages_to_append.append(tool_error_message)
+        messages_to_append.append(
+            _tool_error_message(tool_call_id, f"找不到工具 '{tool_name}'")
+        )
         return (tool_call, messages_to_append, False)
 
     # 使用 Langfuse 观测工具调用
@@ -242,25 +299,21 @@ async def _execute_single_tool_call(
         metadata=coerce_langfuse_metadata({"tool_call_id": tool_call_id}),
         trace_context=trace_context,
     ) as tool_span:
+        arguments: Optional[Dict[str, Any]] = None
         try:
-            repaired_arguments_str = repair_tool_call_arguments(arguments_str)
+            # 修复与解析共用同一次 JSON 解析，不再对修复后的字符串重复解析
+            repaired_arguments_str, arguments = repair_and_parse_tool_call_arguments(
+                arguments_str
+            )
             if repaired_arguments_str != arguments_str:
-                push_warning(
-                    f"工具 '{tool_name}' 参数 JSON 已自动修复",
-                    location=get_location(),
-                )
+                push_warning(f"工具 '{tool_name}' 参数 JSON 已自动修复")
                 arguments_str = repaired_arguments_str
 
-            arguments = parse_tool_call_arguments(arguments_str)
             if arguments is None:
                 raise ValueError("工具参数不是合法的 JSON 对象")
 
-            # 更新为解析后的参数
-            tool_span.update(input=arguments)
-
-            push_debug(f"执行工具 '{tool_name}' 参数: {arguments_str}")
-
-            tool_func = tool_map[tool_name]
+            if is_debug_enabled():
+                push_debug(f"执行工具 '{tool_name}' 参数: {arguments_str}")
 
             # 获取原始函数和 Tool 对象（用于检查参数）
             # tool_func 是 tool.run，是一个绑定方法，__self__ 就是 Tool 对象
@@ -289,192 +342,58 @@ async def _execute_single_tool_call(
 
             tool_result = await tool_func(**converted_arguments)
 
-            # 更新工具调用观测数据，序列化输出以便langfuse记录
-            from SimpleLLMFunc.base.tool_call.validation import (
-                is_valid_tool_result,
-                serialize_tool_output_for_langfuse,
+            # 校验结果只做一次，langfuse 序列化直接复用校验结论
+            is_valid_result = is_valid_tool_result(tool_result)
+            serialized_output = serialize_tool_output_for_langfuse(
+                tool_result, known_valid=is_valid_result
             )
+            # 解析后的参数与输出合并为一次观测更新
+            tool_span.update(input=arguments, output=serialized_output)
 
-            serialized_output = serialize_tool_output_for_langfuse(tool_result)
-            tool_span.update(output=serialized_output)
-
-            if not is_valid_tool_result(tool_result):
+            if not is_valid_result:
                 push_warning(
                     f"工具 '{tool_name}' 返回了不支持的格式: {type(tool_result)}。支持的返回格式包括: str, JSON可序列化对象, ImgPath, ImgUrl, Tuple[str, ImgPath], Tuple[str, ImgUrl]",
-                    location=get_location(),
                 )
-                tool_result_content_json: str = json.dumps(
-                    str(tool_result), ensure_ascii=False, indent=2
+                messages_to_append.append(
+                    _tool_message(tool_call_id, json_utils.dumps(str(tool_result)))
                 )
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "content": tool_result_content_json,
-                }
-                messages_to_append.append(tool_message)
                 return (tool_call, messages_to_append, False)
 
-            if isinstance(tool_result, ImgUrl):
-                image_content = {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": tool_result.url,
-                        "detail": tool_result.detail,
-                    },
-                }
-
-                user_multimodal_message = {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"这是工具 '{tool_name}' 返回的图像：",
-                        },
-                        image_content,
-                    ],
-                }
-                messages_to_append.append(user_multimodal_message)
-                return (tool_call, messages_to_append, True)
-
-            if isinstance(tool_result, ImgPath):
-                base64_img = tool_result.to_base64()
-                mime_type = tool_result.get_mime_type()
-                data_url = f"data:{mime_type};base64,{base64_img}"
-
-                image_content = {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": data_url,
-                        "detail": tool_result.detail,
-                    },
-                }
-
-                user_multimodal_message = {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": f"这是工具 '{tool_name}' 返回的图像文件：",
-                        },
-                        image_content,
-                    ],
-                }
-                messages_to_append.append(user_multimodal_message)
+            image_result = _match_image_result(tool_result)
+            if image_result is not None:
+                if image_result.is_path:
+                    # 读取图片文件并做 base64 编码可能较慢，放到线程池执行以免阻塞事件循环
+                    multimodal_message = await asyncio.to_thread(
+                        _image_result_message, tool_name, image_result
+                    )
+                else:
+                    multimodal_message = _image_result_message(tool_name, image_result)
+                messages_to_append.append(multimodal_message)
                 return (tool_call, messages_to_append, True)
 
-            if isinstance(tool_result, tuple) and len(tool_result) == 2:
-                text_part, img_part = tool_result
-                if isinstance(text_part, str) and isinstance(img_part, ImgUrl):
-                    image_content = {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": img_part.url,
-                            "detail": img_part.detail,
-                        },
-                    }
-
-                    user_multimodal_message = {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"这是工具 '{tool_name}' 返回的图像和说明：{text_part}",
-                            },
-                            image_content,
-                        ],
-                    }
-                    messages_to_append.append(user_multimodal_message)
-                    return (tool_call, messages_to_append, True)
-
-                if isinstance(text_part, str) and isinstance(img_part, ImgPath):
-                    base64_img = img_part.to_base64()
-                    mime_type = img_part.get_mime_type()
-                    data_url = f"data:{mime_type};base64,{base64_img}"
-
-                    image_content = {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": data_url,
-                            "detail": img_part.detail,
-                        },
-                    }
-
-                    user_multimodal_message = {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": f"这是工具 '{tool_name}' 返回的图像文件和说明：{text_part}",
-                            },
-                            image_content,
-                        ],
-                    }
-                    messages_to_append.append(user_multimodal_message)
-                    return (tool_call, messages_to_append, True)
-
-                tool_result_content_json = json.dumps(
-                    tool_result, ensure_ascii=False, indent=2
-                )
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "content": tool_result_content_json,
-                }
-                messages_to_append.append(tool_message)
+            # 结果已通过 is_valid_tool_result 校验，只需编码一次，调试日志直接复用编码结果；
+            # 内容只给模型阅读，使用紧凑格式以减少 token
+            tool_result_content_json = json_utils.dumps(tool_result)
+            messages_to_append.append(
+                _tool_message(tool_call_id, tool_result_content_json)
+            )
+            if is_debug_enabled():
                 push_debug(f"工具 '{tool_name}' 执行完成: {tool_result_content_json}")
-                return (tool_call, messages_to_append, False)
-
-            if isinstance(tool_result, (Text, str)):
-                tool_result_content_json = json.dumps(
-                    tool_result, ensure_ascii=False, indent=2
-                )
-
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "content": tool_result_content_json,
-                }
-            else:
-                tool_result_content_json = json.dumps(
-                    tool_result, ensure_ascii=False, indent=2
-                )
-
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": tool_call_id,
-                    "content": tool_result_content_json,
-                }
-
-            messages_to_append.append(tool_message)
-
-            if isinstance(tool_result, (ImgUrl, ImgPath)):
-                push_debug(
-                    f"工具 '{tool_name}' 执行完成: image payload",
-                    location=get_location(),
-                )
-            else:
-                push_debug(
-                    f"工具 '{tool_name}' 执行完成: {json.dumps(tool_result, ensure_ascii=False)}"
-                )
 
         except Exception as exc:
             error_message = f"工具 '{tool_name}' 以参数 {arguments_str} 在执行或结果解析中出错，错误: {str(exc)}"
             push_error(error_message)
 
-            # 记录错误到langfuse
-            tool_span.update(
-                output={"error": error_message, "exception_type": type(exc).__name__},
-                level="ERROR",
-            )
-
-            tool_error_message = {
-                "role": "tool",
-                "tool_call_id": tool_call_id,
-                "content": json.dumps(
-                    {"error": error_message}, ensure_ascii=False, indent=2
-                ),
+            # 记录错误到langfuse，参数已解析时一并更新为解析后的参数
+            error_update: Dict[str, Any] = {
+                "output": {"error": error_message, "exception_type": type(exc).__name__},
+                "level": "ERROR",
             }
-            messages_to_append.append(tool_error_message)
+            if arguments is not None:
+                error_update["input"] = arguments
+            tool_span.update(**error_update)
+
+            messages_to_append.append(_tool_error_message(tool_call_id, error_message))
 
     return (tool_call, messages_to_append, False)
 
@@ -488,7 +407,7 @@ async def process_tool_calls(
 ) -> List[Dict[str, Any]]:
     """Execute tool calls concurrently and append results to the message history.
 
-    All tool calls are executed in parallel using structured concurrency with asyncio.gather(),
+    All tool calls are executed in parallel using structured concurrency with asyncio.TaskGroup,
     then results are appended to messages in the original order.
 
     对于多模态工具调用，会先插入一个 assistant message 说明将使用该工具，
@@ -526,36 +445,54 @@ async def process_tool_calls(
 
     # Execute all tool calls concurrently
     trace_context = get_langfuse_trace_context()
-    tasks = [
-        asyncio.create_task(
-            _execute_single_tool_call(
-                tool_call,
-                tool_map,
-                event_emitter,
-                trace_context=trace_context,
-            )
-        )
-        for tool_call in tool_calls
-    ]
+
+    async def _run_all() -> List[tuple[Dict[str, Any], List[Dict[str, Any]], bool]]:
+        if len(tool_calls) == 1:
+            # 单个工具调用（最常见的情况）直接等待，无需创建任务组和子任务
+            return [
+                await _execute_single_tool_call(
+                    tool_calls[0],
+                    tool_map,
+                    event_emitter,
+                    trace_context=trace_context,
+                )
+            ]
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        _execute_single_tool_call(
+                            tool_call,
+                            tool_map,
+                            event_emitter,
+                            trace_context=trace_context,
+                        )
+                    )
+                    for tool_call in tool_calls
+                ]
+        except BaseExceptionGroup as group:
+            # 与 gather 不同，TaskGroup 在首个工具失败时会取消其余工具任务；
+            # 对外抛出第一个失败的原因以保持异常类型，完整的异常组保留在 __cause__ 中
+            raise group.exceptions[0] from group
+        # TaskGroup 退出时所有任务都已完成，结果顺序与 tool_calls 一致
+        return [task.result() for task in tasks]
 
     if abort_signal is None:
-        results = await asyncio.gather(*tasks)
+        results = await _run_all()
     else:
+        run_task = asyncio.create_task(_run_all())
         abort_task = asyncio.create_task(abort_signal.wait())
-        gather_future = asyncio.gather(*tasks)
         done, _ = await asyncio.wait(
-            {abort_task, gather_future},
+            {abort_task, run_task},
             return_when=asyncio.FIRST_COMPLETED,
         )
         if abort_task in done:
-            gather_future.cancel()
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
-            await asyncio.gather(gather_future, return_exceptions=True)
+            # 取消外层任务时 TaskGroup 会取消并等待所有仍在运行的工具任务
+            run_task.cancel()
+            await asyncio.gather(run_task, return_exceptions=True)
             return messages
         abort_task.cancel()
-        results = await gather_future
+        results = run_task.result()
 
     # 分类结果：普通工具调用和多模态工具调用
     normal_results: List[List[Dict[str, Any]]] = []
@@ -624,8 +561,9 @@ async def process_tool_calls(
     # 这样做是因为 OpenAI API 的标准 tool_call 机制无法处理多模态结果
     # 所以我们用消息对的方式来模拟工具调用的交互过程
     for tool_call_dict, user_messages in multimodal_results:
-        tool_name = tool_call_dict.get("function", {}).get("name", "unknown")
-        arguments = tool_call_dict.get("function", {}).get("arguments", "{}")
+        function_call = tool_call_dict.get("function") or {}
+        tool_name = function_call.get("name", "unknown")
+        arguments = function_call.get("arguments", "{}")
 
         # 创建assistant message说明将使用该工具
         assistant_message = {
@@ -638,3 +576,85 @@ async def process_tool_calls(
         current_messages.extend(user_messages)
 
     return current_messages
+
+
+async def process_tool_calls_streaming(
+    tool_calls: List[Dict[str, Any]],
+    tool_map: Dict[str, Callable[..., Awaitable[Any]]],
+    event_emitter: Any = None,
+    abort_signal: Optional[AbortSignal] = None,
+    *,
+    preserve_order: bool = True,
+) -> AsyncIterator[tuple[Dict[str, Any], List[Dict[str, Any]], bool]]:
+    """Execute tool calls concurrently and yield each result as soon as possible.
+
+    与 process_tool_calls 不同，本函数不会等待最慢的工具结束后才返回，
+    适合需要边执行边消费工具结果的调用方。
+
+    Args:
+        tool_calls: 要执行的工具调用列表
+        tool_map: 工具名称到函数的映射字典
+        event_emitter: 注入给支持事件的工具的事件发射器
+        abort_signal: 中止信号；触发后停止产出结果并取消仍在运行的工具任务
+        preserve_order: 为 True 时按 tool_calls 的原始顺序产出结果（先完成的结果
+            会暂存，直到它之前的结果全部产出）；为 False 时按完成顺序产出
+
+    Yields:
+        与 _execute_single_tool_call 相同的 (tool_call_dict, messages, is_multimodal)，
+        多模态结果如何并入消息历史由调用方决定
+
+    Note:
+        提前关闭生成器或触发中止信号时，仍在运行的工具任务会被取消。
+    """
+
+    if not tool_calls:
+        return
+
+    if abort_signal is not None and abort_signal.is_aborted:
+        return
+
+    trace_context = get_langfuse_trace_context()
+    tasks = [
+        asyncio.create_task(
+            _execute_single_tool_call(
+                tool_call,
+                tool_map,
+                event_emitter,
+                trace_context=trace_context,
+            )
+        )
+        for tool_call in tool_calls
+    ]
+    task_indices = {task: index for index, task in enumerate(tasks)}
+    buffered: Dict[int, tuple[Dict[str, Any], List[Dict[str, Any]], bool]] = {}
+    next_index = 0
+    abort_task = (
+        asyncio.create_task(abort_signal.wait()) if abort_signal is not None else None
+    )
+
+    try:
+        pending = set(tasks)
+        while pending:
+            waiting = pending if abort_task is None else pending | {abort_task}
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if abort_task in done:
+                # 中止后不再产出结果，finally 中会取消仍在运行的工具任务
+                return
+            pending -= done
+            for task in sorted(done, key=task_indices.__getitem__):
+                if preserve_order:
+                    buffered[task_indices[task]] = task.result()
+                else:
+                    yield task.result()
+
+            # 产出从 next_index 开始已连续完成的结果
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        if abort_task is not None:
+            abort_task.cancel()
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -2,26 +2,26 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from SimpleLLMFunc.logger import push_error, push_warning
-from SimpleLLMFunc.logger.logger import get_location
 
-# 从统一类型系统导入类型
+# 从统一类型系统导入类型（AccumulatedToolCall/ToolCallFunctionInfo 供包内重新导出）
 from SimpleLLMFunc.type.message import ReasoningDetail
 from SimpleLLMFunc.type.tool_call import (
     AccumulatedToolCall,
     ToolCallArguments,
     ToolCallFunctionInfo,
 )
+from SimpleLLMFunc.utils import json_utils
 
 
 def _try_parse_tool_call_arguments(candidate: str) -> ToolCallArguments | None:
     """Try parsing one candidate JSON string as tool-call arguments dict."""
 
     try:
-        parsed = json.loads(candidate)
+        parsed = json_utils.loads(candidate)
     except Exception:
         return None
 
@@ -159,41 +159,140 @@ def parse_tool_call_arguments(
     return None
 
 
-def repair_tool_call_arguments(arguments_str: str) -> str:
-    """Repair malformed tool-call arguments and return best JSON string."""
+def repair_and_parse_tool_call_arguments(
+    arguments_str: str,
+) -> tuple[str, ToolCallArguments | None]:
+    """Repair malformed tool-call arguments and parse them in one pass.
+
+    Returns:
+        The best JSON string and its parsed dict, or None when no repair
+        candidate parses to a dict.
+    """
 
     for candidate in _build_argument_candidates(arguments_str, allow_closure=True):
-        if _try_parse_tool_call_arguments(candidate) is not None:
-            return candidate
+        parsed = _try_parse_tool_call_arguments(candidate)
+        if parsed is not None:
+            return candidate, parsed
 
     value = arguments_str.strip()
-    return value if value else "{}"
+    return (value if value else "{}"), None
+
+
+def repair_tool_call_arguments(arguments_str: str) -> str:
+    """Repair malformed tool-call arguments and return best JSON string."""
+
+    return repair_and_parse_tool_call_arguments(arguments_str)[0]
 
 
 def extract_tool_calls(response: Any) -> List[Dict[str, Any]]:
     """Extract tool-call metadata from a synchronous response."""
 
-    tool_calls: List[Dict[str, Any]] = []
+    # 直接访问属性，响应结构不完整时按没有工具调用处理
+    try:
+        message_tool_calls = response.choices[0].message.tool_calls
+    except (AttributeError, IndexError, TypeError):
+        return []
+
+    if not message_tool_calls:
+        return []
 
     try:
-        if hasattr(response, "choices") and len(response.choices) > 0:
-            message = response.choices[0].message
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                for tool_call in message.tool_calls:
-                    tool_calls.append(
-                        {
-                            "id": tool_call.id,
-                            "type": getattr(tool_call, "type", "function"),
-                            "function": {
-                                "name": tool_call.function.name,
-                                "arguments": tool_call.function.arguments,
-                            },
-                        }
-                    )
+        return [
+            {
+                "id": tool_call.id,
+                "type": getattr(tool_call, "type", "function"),
+                "function": {
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments,
+                },
+            }
+            for tool_call in message_tool_calls
+        ]
     except Exception as exc:
         push_error(f"提取工具调用时出错: {str(exc)}")
-    finally:
-        return tool_calls
+        return []
+
+
+@dataclass(slots=True)
+class _PendingToolCall:
+    """Mutable per-index state of a tool call being assembled from a stream."""
+
+    id: Optional[str] = None
+    type: Optional[str] = None
+    name: Optional[str] = None
+    arguments: List[str] = field(default_factory=list)
+
+
+class ToolCallAccumulator:
+    """Incrementally merge streaming tool-call fragments keyed by index.
+
+    Fragments are folded into their tool call as they arrive, so callers do
+    not need to keep every fragment of a stream around until it ends.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[int, _PendingToolCall] = {}
+
+    def consume(self, tool_call_chunks: List[Dict[str, Any]]) -> None:
+        """Merge the tool-call fragments extracted from one stream chunk."""
+
+        for chunk in tool_call_chunks:
+            index = chunk.get("index")
+            if index is None:
+                push_warning("工具调用 chunk 缺少 'index' 属性，已跳过处理")
+                continue
+
+            call = self._calls.get(index)
+            if call is None:
+                call = self._calls[index] = _PendingToolCall()
+
+            # 每个字段只查一次，多数 chunk 只携带一段参数
+            call_id = chunk.get("id")
+            if call_id:
+                call.id = call_id
+            call_type = chunk.get("type")
+            if call_type:
+                call.type = call_type
+
+            function_chunk = chunk.get("function")
+            if function_chunk:
+                name = function_chunk.get("name")
+                if name:
+                    call.name = name
+                arguments = function_chunk.get("arguments")
+                if arguments:
+                    call.arguments.append(arguments)
+
+    def feed(self, chunk: Any) -> List[Dict[str, Any]]:
+        """Extract the tool-call fragments of one stream chunk and merge them.
+
+        Returns the fragments so callers can still react to per-chunk deltas.
+        """
+
+        tool_call_chunks = extract_tool_calls_from_stream_response(chunk)
+        if tool_call_chunks:
+            self.consume(tool_call_chunks)
+        return tool_call_chunks
+
+    def build(self) -> List[Dict[str, Any]]:
+        """Return the complete tool calls merged so far."""
+
+        complete_tool_calls: List[Dict[str, Any]] = []
+        for call in self._calls.values():
+            if call.id and call.name:
+                repaired_arguments = repair_tool_call_arguments("".join(call.arguments))
+                complete_tool_calls.append(
+                    {
+                        "id": call.id,
+                        "type": call.type or "function",
+                        "function": {
+                            "name": call.name,
+                            "arguments": repaired_arguments,
+                        },
+                    }
+                )
+
+        return complete_tool_calls
 
 
 def accumulate_tool_calls_from_chunks(
@@ -201,102 +300,81 @@ def accumulate_tool_calls_from_chunks(
 ) -> List[Dict[str, Any]]:
     """Merge tool-call chunks emitted during streaming responses."""
 
-    accumulated_calls: Dict[int, AccumulatedToolCall] = {}
-
-    for chunk in tool_call_chunks:
-        index = chunk.get("index")
-        if index is None:
-            push_warning(
-                "工具调用 chunk 缺少 'index' 属性，已跳过处理",
-                location=get_location(),
-            )
-            continue
-
-        if index not in accumulated_calls:
-            accumulated_calls[index] = AccumulatedToolCall(
-                id=None,
-                type=None,
-                function=ToolCallFunctionInfo(name=None, arguments=""),
-            )
-
-        if chunk.get("id"):
-            accumulated_calls[index]["id"] = chunk["id"]
-        if chunk.get("type"):
-            accumulated_calls[index]["type"] = chunk["type"]
-
-        if "function" in chunk:
-            function_chunk = chunk["function"]
-            func_info = accumulated_calls[index]["function"]
-            if function_chunk.get("name"):
-                func_info["name"] = function_chunk["name"]
-            if function_chunk.get("arguments"):
-                func_info["arguments"] += function_chunk["arguments"]
-
-    complete_tool_calls: List[Dict[str, Any]] = []
-    for call in accumulated_calls.values():
-        if call["id"] and call["function"]["name"]:
-            if not call["type"]:
-                call["type"] = "function"
-            repaired_arguments = repair_tool_call_arguments(
-                call["function"]["arguments"]
-            )
-            complete_tool_calls.append(
-                {
-                    "id": call["id"],
-                    "type": call["type"],
-                    "function": {
-                        "name": call["function"]["name"],
-                        "arguments": repaired_arguments,
-                    },
-                }
-            )
-
-    return complete_tool_calls
+    accumulator = ToolCallAccumulator()
+    accumulator.consume(tool_call_chunks)
+    return accumulator.build()
 
 
 def extract_tool_calls_from_stream_response(chunk: Any) -> List[Dict[str, Any]]:
     """Extract tool-call fragments from a streaming chunk."""
 
+    # 每个流式 chunk 都会调用，直接访问属性，缺失时按没有工具调用处理
+    try:
+        delta_tool_calls = chunk.choices[0].delta.tool_calls
+    except (AttributeError, IndexError, TypeError):
+        return []
+
+    if not delta_tool_calls:
+        return []
+
     tool_call_chunks: List[Dict[str, Any]] = []
 
     try:
-        if hasattr(chunk, "choices") and len(chunk.choices) > 0:
-            choice = chunk.choices[0]
-            if hasattr(choice, "delta") and choice.delta:
-                delta = choice.delta
-                if hasattr(delta, "tool_calls") and delta.tool_calls:
-                    for tool_call in delta.tool_calls:
-                        tool_call_chunk: Dict[str, Any] = {
-                            "index": getattr(tool_call, "index", None),
-                            "id": getattr(tool_call, "id", None),
-                            "type": getattr(tool_call, "type", None),
-                        }
-
-                        if hasattr(tool_call, "function") and tool_call.function:
-                            function_info: Dict[str, Any] = {}
-                            if (
-                                hasattr(tool_call.function, "name")
-                                and tool_call.function.name
-                            ):
-                                function_info["name"] = tool_call.function.name
-                            if (
-                                hasattr(tool_call.function, "arguments")
-                                and tool_call.function.arguments
-                            ):
-                                function_info["arguments"] = (
-                                    tool_call.function.arguments
-                                )
-
-                            if function_info:
-                                tool_call_chunk["function"] = function_info
-
-                        tool_call_chunks.append(tool_call_chunk)
+        for tool_call in delta_tool_calls:
+            tool_call_chunk: Dict[str, Any] = {
+                "index": getattr(tool_call, "index", None),
+                "id": getattr(tool_call, "id", None),
+                "type": getattr(tool_call, "type", None),
+            }
+
+            function = getattr(tool_call, "function", None)
+            if function:
+                function_info: Dict[str, Any] = {}
+                name = getattr(function, "name", None)
+                if name:
+                    function_info["name"] = name
+                arguments = getattr(function, "arguments", None)
+                if arguments:
+                    function_info["arguments"] = arguments
+
+                if function_info:
+                    tool_call_chunk["function"] = function_info
+
+            tool_call_chunks.append(tool_call_chunk)
     except Exception as exc:
         push_error(f"提取流工具调用时出错: {str(exc)}")
 
     return tool_call_chunks
 
 
+def _get_reasoning_details_raw(container: Any) -> Any:
+    """Read raw reasoning_details from a message/delta object or dict."""
+
+    if isinstance(container, dict):
+        return container.get("reasoning_details")
+    return getattr(container, "reasoning_details", None)
+
+
+def _to_reasoning_detail(detail: Any) -> ReasoningDetail:
+    """Normalize one raw reasoning detail, which may be a dict or an object."""
+
+    if isinstance(detail, dict):
+        return ReasoningDetail(
+            id=detail.get("id", ""),
+            format=detail.get("format", ""),
+            index=detail.get("index", 0),
+            type=detail.get("type", "reasoning.encrypted"),
+            data=detail.get("data", ""),
+        )
+    return ReasoningDetail(
+        id=getattr(detail, "id", ""),
+        format=getattr(detail, "format", ""),
+        index=getattr(detail, "index", 0),
+        type=getattr(detail, "type", "reasoning.encrypted"),
+        data=getattr(detail, "data", ""),
+    )
+
+
 def extract_reasoning_details(response: Any) -> List[ReasoningDetail]:
     """从非流式响应中提取 reasoning_details。
 
@@ -306,60 +384,22 @@ def extract_reasoning_details(response: Any) -> List[ReasoningDetail]:
     Returns:
         reasoning_details 列表
     """
-    reasoning_details: List[ReasoningDetail] = []
+    try:
+        message = response.choices[0].message
+    except (AttributeError, IndexError, TypeError):
+        return []
 
     try:
-        if hasattr(response, "choices") and len(response.choices) > 0:
-            message = response.choices[0].message
-
-            # 尝试从 message 中获取 reasoning_details
-            reasoning_details_raw = None
-            if hasattr(message, "reasoning_details"):
-                reasoning_details_raw = message.reasoning_details
-            elif isinstance(message, dict) and "reasoning_details" in message:
-                reasoning_details_raw = message["reasoning_details"]
-
-            if reasoning_details_raw:
-                for detail in reasoning_details_raw:
-                    # 处理 detail 可能是字典或对象的情况
-                    if isinstance(detail, dict):
-                        reasoning_details.append(
-                            ReasoningDetail(
-                                id=detail.get("id", ""),
-                                format=detail.get("format", ""),
-                                index=detail.get("index", 0),
-                                type=detail.get("type", "reasoning.encrypted"),
-                                data=detail.get("data", ""),
-                            )
-                        )
-                    else:
-                        # detail 是对象，尝试获取属性
-                        reasoning_details.append(
-                            ReasoningDetail(
-                                id=getattr(detail, "id", "")
-                                if hasattr(detail, "id")
-                                else "",
-                                format=getattr(detail, "format", "")
-                                if hasattr(detail, "format")
-                                else "",
-                                index=getattr(detail, "index", 0)
-                                if hasattr(detail, "index")
-                                else 0,
-                                type=getattr(detail, "type", "reasoning.encrypted")
-                                if hasattr(detail, "type")
-                                else "reasoning.encrypted",
-                                data=getattr(detail, "data", "")
-                                if hasattr(detail, "data")
-                                else "",
-                            )
-                        )
+        reasoning_details_raw = _get_reasoning_details_raw(message)
+        if not reasoning_details_raw:
+            return []
+        return [_to_reasoning_detail(detail) for detail in reasoning_details_raw]
     except Exception as exc:
         push_error(f"提取 reasoning_details 时出错: {str(exc)}")
         import traceback
 
         push_error(f"详细错误: {traceback.format_exc()}")
-
-    return reasoning_details
+        return []
 
 
 def extract_reasoning_details_from_stream(chunk: Any) -> List[ReasoningDetail]:
@@ -371,59 +411,23 @@ def extract_reasoning_details_from_stream(chunk: Any) -> List[ReasoningDetail]:
     Returns:
         reasoning_details 列表
     """
-    reasoning_details: List[ReasoningDetail] = []
+    # 每个流式 chunk 都会调用，直接访问属性，缺失时按没有推理细节处理
+    try:
+        delta = chunk.choices[0].delta
+    except (AttributeError, IndexError, TypeError):
+        return []
+
+    if not delta:
+        return []
 
     try:
-        if hasattr(chunk, "choices") and len(chunk.choices) > 0:
-            choice = chunk.choices[0]
-            if hasattr(choice, "delta") and choice.delta:
-                delta = choice.delta
-
-                # 尝试从 delta 中获取 reasoning_details
-                reasoning_details_raw = None
-                if hasattr(delta, "reasoning_details"):
-                    reasoning_details_raw = delta.reasoning_details
-                elif isinstance(delta, dict) and "reasoning_details" in delta:
-                    reasoning_details_raw = delta["reasoning_details"]
-
-                if reasoning_details_raw:
-                    for detail in reasoning_details_raw:
-                        # 处理 detail 可能是字典或对象的情况
-                        if isinstance(detail, dict):
-                            reasoning_details.append(
-                                ReasoningDetail(
-                                    id=detail.get("id", ""),
-                                    format=detail.get("format", ""),
-                                    index=detail.get("index", 0),
-                                    type=detail.get("type", "reasoning.encrypted"),
-                                    data=detail.get("data", ""),
-                                )
-                            )
-                        else:
-                            # detail 是对象，尝试获取属性
-                            reasoning_details.append(
-                                ReasoningDetail(
-                                    id=getattr(detail, "id", "")
-                                    if hasattr(detail, "id")
-                                    else "",
-                                    format=getattr(detail, "format", "")
-                                    if hasattr(detail, "format")
-                                    else "",
-                                    index=getattr(detail, "index", 0)
-                                    if hasattr(detail, "index")
-                                    else 0,
-                                    type=getattr(detail, "type", "reasoning.encrypted")
-                                    if hasattr(detail, "type")
-                                    else "reasoning.encrypted",
-                                    data=getattr(detail, "data", "")
-                                    if hasattr(detail, "data")
-                                    else "",
-                                )
-                            )
+        reasoning_details_raw = _get_reasoning_details_raw(delta)
+        if not reasoning_details_raw:
+            return []
+        return [_to_reasoning_detail(detail) for detail in reasoning_details_raw]
     except Exception as exc:
         push_error(f"提取流式 reasoning_details 时出错: {str(exc)}")
         import traceback
 
         push_error(f"详细错误: {traceback.format_exc()}")
-
-    return reasoning_details
+        return []
@@ -2,17 +2,65 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from SimpleLLMFunc.type.multimodal import ImgPath, ImgUrl, Text
+from SimpleLLMFunc.utils import json_utils
 
+# 可以直接编码的标量类型，按精确类型查表（子类交给编码器判断）
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_JSON_CONTAINER_TYPES = frozenset({list, tuple, dict})
+# 与 orjson 的嵌套深度上限一致，同时用于在循环引用时终止遍历
+_MAX_JSON_DEPTH = 254
 
-def serialize_tool_output_for_langfuse(result: Any) -> Any:
+
+def _is_json_serializable(value: Any) -> bool:
+    """按结构检查值能否被 json_utils.dumps 编码，遇到第一个非法节点即返回。
+
+    只有无法按类型判断的节点（如 str/dict 的子类、枚举）才交给编码器单独试编码，
+    避免为了探测而把整个结果完整编码一次。
+    """
+
+    stack = [(value, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_type = type(node)
+        if node_type in _JSON_SCALAR_TYPES:
+            continue
+        if node_type not in _JSON_CONTAINER_TYPES:
+            if not _encodes(node):
+                return False
+            continue
+        if depth >= _MAX_JSON_DEPTH:
+            return False
+        if node_type is dict:
+            for key, item in node.items():
+                if type(key) not in _JSON_SCALAR_TYPES and not _encodes({key: None}):
+                    return False
+                stack.append((item, depth + 1))
+        else:
+            stack.extend((item, depth + 1) for item in node)
+    return True
+
+
+def _encodes(value: Any) -> bool:
+    """单独试编码一个无法按类型判断的节点"""
+    try:
+        json_utils.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def serialize_tool_output_for_langfuse(
+    result: Any, *, known_valid: bool = False
+) -> Any:
     """序列化工具输出以便langfuse记录。
 
     Args:
         result: 工具返回的原始结果
+        known_valid: 调用方已确认 is_valid_tool_result(result) 为真时传入 True，
+            可跳过重复的可序列化检查
 
     Returns:
         序列化后的结果，适合langfuse记录
@@ -44,11 +92,9 @@ def serialize_tool_output_for_langfuse(result: Any) -> Any:
         return str(result.content)
 
     # 对于其他类型，尝试直接返回（JSON可序列化的对象）或转为字符串
-    try:
-        json.dumps(result)
+    if known_valid or _is_json_serializable(result):
         return result
-    except (TypeError, ValueError):
-        return str(result)
+    return str(result)
 
 
 def is_valid_tool_result(result: Any) -> bool:
@@ -66,9 +112,5 @@ def is_valid_tool_result(result: Any) -> bool:
             return True
         return False
 
-    try:
-        json.dumps(result)
-        return True
-    except (TypeError, ValueError):
-        return False
+    return _is_json_serializable(result)
 
@@ -2,14 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Type
-
-from pydantic import BaseModel
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from annotated_types import Ge, Gt, Interval, Le, Lt
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from SimpleLLMFunc.base.type_resolve.xml_utils import (
+    generate_xml_example,
+    pydantic_to_xml_schema,
+)
+
+_T = TypeVar("_T")
+
+# 类型描述只取决于类型本身，每次调用 LLM 函数都会重新生成，按类型缓存
+_TYPE_DESCRIPTION_CACHE_SIZE = 512
+
+
+def _call_cached(
+    cached: Callable[..., _T], uncached: Callable[..., _T], type_hint: Any, *args: Any
+) -> _T:
+    """可哈希的类型走缓存，不可哈希的类型（如带字典元数据的 Annotated）直接计算"""
+    try:
+        hash(type_hint)
+    except TypeError:
+        return uncached(type_hint, *args)
+    return cached(type_hint, *args)
 
 
 def get_detailed_type_description(type_hint: Any) -> str:
     """Generate a human-readable description for a type hint."""
 
+    return _call_cached(_cached_type_description, _describe_type, type_hint)
+
+
+def _describe_type(type_hint: Any) -> str:
     if type_hint is None:
         return "未知类型"
 
@@ -17,14 +57,14 @@ def get_detailed_type_description(type_hint: Any) -> str:
         return describe_pydantic_model(type_hint)
 
     origin = getattr(type_hint, "__origin__", None)
-    if origin is list or origin is List:
+    if origin is list:
         args = getattr(type_hint, "__args__", [])
         if args:
             item_type_desc = get_detailed_type_description(args[0])
             return f"List[{item_type_desc}]"
         return "List"
 
-    if origin is dict or origin is Dict:
+    if origin is dict:
         args = getattr(type_hint, "__args__", [])
         if len(args) >= 2:
             key_type_desc = get_detailed_type_description(args[0])
@@ -35,30 +75,96 @@ def get_detailed_type_description(type_hint: Any) -> str:
     return str(type_hint)
 
 
+_cached_type_description = lru_cache(maxsize=_TYPE_DESCRIPTION_CACHE_SIZE)(
+    _describe_type
+)
+
+
+_JSON_TYPE_NAMES: Dict[Any, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+    NoneType: "null",
+}
+
+
+def _json_type_name(annotation: Any) -> str:
+    """返回字段注解对应的 JSON 类型名，Optional[X] 按 X 处理"""
+    origin = get_origin(annotation)
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return _json_type_name(args[0])
+        return "unknown"
+    if origin in _JSON_TYPE_NAMES:
+        return _JSON_TYPE_NAMES[origin]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "object"
+    if annotation in _JSON_TYPE_NAMES:
+        return _JSON_TYPE_NAMES[annotation]
+    # Literal、Enum、datetime、UUID 等非基础类型按 pydantic 生成的 JSON Schema 取类型
+    try:
+        return TypeAdapter(annotation).json_schema().get("type", "unknown")
+    except Exception:
+        return "unknown"
+
+
+def _describe_constraints(metadata: List[Any]) -> str:
+    """从字段元数据中提取数值边界，Interval 与 Ge/Le/Gt/Lt 均会展开"""
+    bounds: Dict[str, Any] = {}
+    for constraint in metadata:
+        if isinstance(constraint, Interval):
+            for key in ("ge", "le", "gt", "lt"):
+                if getattr(constraint, key) is not None:
+                    bounds[key] = getattr(constraint, key)
+        elif isinstance(constraint, Ge):
+            bounds["ge"] = constraint.ge
+        elif isinstance(constraint, Le):
+            bounds["le"] = constraint.le
+        elif isinstance(constraint, Gt):
+            bounds["gt"] = constraint.gt
+        elif isinstance(constraint, Lt):
+            bounds["lt"] = constraint.lt
+
+    labels = {"ge": "最小值", "gt": "大于", "le": "最大值", "lt": "小于"}
+    return "".join(
+        f", {labels[key]}: {bounds[key]}" for key in labels if key in bounds
+    )
+
+
+def _describe_default(default: Any) -> Any:
+    """与 JSON Schema 一致地渲染默认值，例如 Enum 取其 value"""
+    try:
+        return to_jsonable_python(default)
+    except Exception:
+        return default
+
+
+@lru_cache(maxsize=_TYPE_DESCRIPTION_CACHE_SIZE)
 def describe_pydantic_model(model_class: Type[BaseModel]) -> str:
     """Expand a Pydantic model to a descriptive summary."""
 
     model_name = model_class.__name__
-    schema = model_class.model_json_schema()
-
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
 
+    # 直接读取 model_fields，避免为了描述文本生成完整的 JSON Schema
     fields_desc = []
-    for field_name, field_info in properties.items():
-        field_type = field_info.get("type", "unknown")
-        field_desc = field_info.get("description", "")
-        is_required = field_name in required
+    for attr_name, field in model_class.model_fields.items():
+        # 与 model_json_schema 默认的 by_alias=True 一致，使用校验时接受的别名
+        field_name = field.alias or attr_name
+        field_type = _json_type_name(field.annotation)
+        field_desc = field.description or ""
+        is_required = field.is_required()
 
         req_marker = "必填" if is_required else "可选"
 
-        extra_info = ""
-        if "minimum" in field_info:
-            extra_info += f", 最小值: {field_info['minimum']}"
-        if "maximum" in field_info:
-            extra_info += f", 最大值: {field_info['maximum']}"
-        if "default" in field_info:
-            extra_info += f", 默认值: {field_info['default']}"
+        extra_info = _describe_constraints(field.metadata)
+        if not is_required and field.default_factory is None:
+            extra_info += f", 默认值: {_describe_default(field.default)}"
 
         fields_desc.append(
             f"  - {field_name} ({field_type}, {req_marker}): {field_desc}{extra_info}"
@@ -82,41 +188,18 @@ def build_type_description_xml(
     - Fully expands nested BaseModel, List, Dict, and Union (excluding NoneType)
     - Guards against cycles and excessive depth
     - Returns XML Schema description as text
+    - Top-level calls are cached per (type_hint, max_depth)
     """
-    from SimpleLLMFunc.base.type_resolve.xml_utils import pydantic_to_xml_schema
-
-    return pydantic_to_xml_schema(type_hint, depth, max_depth, seen)
+    if depth or seen:
+        return pydantic_to_xml_schema(type_hint, depth, max_depth, seen)
+    return _call_cached(
+        _cached_type_description_xml, pydantic_to_xml_schema, type_hint, 0, max_depth
+    )
 
 
-def _generate_primitive_example(type_hint: Any) -> Any:
-    """Generate example value for primitive types directly.
-
-    Also handles Optional[T] by extracting the inner type.
-    """
-    from typing import get_origin, get_args, Union as TypingUnion
-
-    # Handle Optional[T] / Union[T, None]
-    origin = get_origin(type_hint)
-    if origin is TypingUnion:
-        args = get_args(type_hint)
-        # Extract first non-None type from Union
-        for t in args:
-            if t is not type(None):
-                return _generate_primitive_example(t)  # Recursively check inner type
-
-    # Primitive types
-    if type_hint is str:
-        return "example"
-    if type_hint is int:
-        return 123
-    if type_hint is float:
-        return 1.23
-    if type_hint is bool:
-        return True
-    if type_hint is type(None):
-        return None
-
-    return None  # Not a primitive, need recursive handling
+_cached_type_description_xml = lru_cache(maxsize=_TYPE_DESCRIPTION_CACHE_SIZE)(
+    pydantic_to_xml_schema
+)
 
 
 def generate_example_xml(
@@ -125,8 +208,16 @@ def generate_example_xml(
     max_depth: int = 5,
     seen: Optional[set] = None,
 ) -> str:
-    """Generate an example XML string for the given type hint (recursive)."""
-    from SimpleLLMFunc.base.type_resolve.xml_utils import generate_xml_example
+    """Generate an example XML string for the given type hint (recursive).
+
+    Top-level calls are cached per (type_hint, max_depth).
+    """
+    if depth or seen:
+        return generate_xml_example(type_hint, depth, max_depth, seen)
+    return _call_cached(_cached_example_xml, generate_xml_example, type_hint, 0, max_depth)
+
 
-    return generate_xml_example(type_hint, depth, max_depth, seen)
+_cached_example_xml = lru_cache(maxsize=_TYPE_DESCRIPTION_CACHE_SIZE)(
+    generate_xml_example
+)
 
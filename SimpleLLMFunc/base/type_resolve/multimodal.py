@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import UnionType
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
 
 from SimpleLLMFunc.type.multimodal import ImgPath, ImgUrl, Text
 
+_MM_TYPES = (Text, ImgUrl, ImgPath)
+_SEQ_TYPES = (list, tuple)
+_MISSING = object()
+
 
 def has_multimodal_content(
     arguments: Dict[str, Any],
@@ -14,48 +19,50 @@ def has_multimodal_content(
 ) -> bool:
     """Check whether arguments contain multimodal payloads."""
 
-    exclude_params = exclude_params or []
+    excluded = frozenset(exclude_params) if exclude_params else frozenset()
 
-    for param_name, param_value in arguments.items():
-        if param_name in exclude_params:
+    # 只有带注解的参数才可能是多模态内容，因此遍历 type_hints 而非全部参数
+    for param_name, annotation in type_hints.items():
+        if param_name in excluded:
             continue
 
-        if param_name in type_hints:
-            annotation = type_hints[param_name]
-            if is_multimodal_type(param_value, annotation):
-                return True
+        param_value = arguments.get(param_name, _MISSING)
+        if param_value is _MISSING:
+            continue
+        if is_multimodal_type(param_value, annotation):
+            return True
     return False
 
 
 def is_multimodal_type(value: Any, annotation: Any) -> bool:
     """Determine whether a value/annotation pair represents multimodal content."""
 
-    from typing import List as TypingList, Union, get_args, get_origin
-
-    if isinstance(value, (Text, ImgUrl, ImgPath)):
+    if isinstance(value, _MM_TYPES):
         return True
 
     origin = get_origin(annotation)
     args = get_args(annotation)
 
-    if origin is Union:
+    if origin is Union or origin is UnionType:
         non_none_args = [arg for arg in args if arg is not type(None)]
         for arg_type in non_none_args:
             if is_multimodal_type(value, arg_type):
                 return True
         return False
 
-    if origin in (list, TypingList):
+    if origin is list:
         if not args:
             return False
         element_type = args[0]
-        if element_type in (Text, ImgUrl, ImgPath):
+        if element_type in _MM_TYPES:
             return True
-        if isinstance(value, (list, tuple)):
-            return any(isinstance(item, (Text, ImgUrl, ImgPath)) for item in value)
+        if isinstance(value, _SEQ_TYPES):
+            for item in value:
+                if isinstance(item, _MM_TYPES):
+                    return True
         return False
 
-    if annotation in (Text, ImgUrl, ImgPath):
+    if annotation in _MM_TYPES:
         return True
 
     return False
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Type, Union, get_origin, get_args
+from types import UnionType
+from typing import Any, Dict, Optional, Type, Union, get_origin, get_args
 from xml.sax.saxutils import escape
 
 from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
 
 
 def _get_root_element_name(type_hint: Any) -> str:
@@ -16,16 +18,18 @@ def _get_root_element_name(type_hint: Any) -> str:
     return "result"
 
 
+_XML_TYPE_NAMES: Dict[Any, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+
 def _python_to_xml_type(py_type: Any) -> str:
     """将 Python 类型转换为 XML Schema 类型描述"""
-    mapping: Dict[Any, str] = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        type(None): "null",
-    }
-    return mapping.get(py_type, "string")
+    return _XML_TYPE_NAMES.get(py_type, "string")
 
 
 def _convert_value_to_string(value: Any) -> str:
@@ -49,8 +53,6 @@ def pydantic_to_xml_schema(
     seen: Optional[set] = None,
 ) -> str:
     """生成 Pydantic 模型的 XML Schema 描述文本"""
-    from typing import get_origin, get_args, Union as TypingUnion
-
     if seen is None:
         seen = set()
 
@@ -111,19 +113,19 @@ def pydantic_to_xml_schema(
     args = get_args(type_hint)
 
     # List / sequence
-    if origin in (list, List):
+    if origin is list:
         items_type = args[0] if args else Any
         item_desc = pydantic_to_xml_schema(items_type, depth + 1, max_depth, seen)
         return f"<list>\n  <item> ({item_desc})</item>\n</list>"
 
     # Dict mapping
-    if origin in (dict, Dict):
+    if origin is dict:
         value_type = args[1] if len(args) >= 2 else Any
         value_desc = pydantic_to_xml_schema(value_type, depth + 1, max_depth, seen)
         return f"<dict>\n  <key> (string)</key>\n  <value> ({value_desc})</value>\n</dict>"
 
     # Union / Optional
-    if origin is TypingUnion:
+    if origin is Union or origin is UnionType:
         non_none = [t for t in args if t is not type(None)]
         if len(non_none) == 1:
             return pydantic_to_xml_schema(non_none[0], depth + 1, max_depth, seen)
@@ -136,29 +138,31 @@ def pydantic_to_xml_schema(
     return _python_to_xml_type(type_hint)
 
 
+_PRIMITIVE_EXAMPLES: Dict[Any, Any] = {
+    str: "example",
+    int: 123,
+    float: 1.23,
+    bool: True,
+    type(None): None,
+}
+
+
 def _generate_primitive_example(type_hint: Any) -> Any:
     """生成基本类型的示例值"""
-    from typing import get_origin, get_args, Union as TypingUnion
+    try:
+        if type_hint in _PRIMITIVE_EXAMPLES:
+            return _PRIMITIVE_EXAMPLES[type_hint]
+    except TypeError:
+        # 不可哈希的类型注解（如带字典元数据的 Annotated）不是基本类型
+        return None
 
     # Handle Optional[T] / Union[T, None]
     origin = get_origin(type_hint)
-    if origin is TypingUnion:
-        args = get_args(type_hint)
-        for t in args:
+    if origin is Union or origin is UnionType:
+        for t in get_args(type_hint):
             if t is not type(None):
                 return _generate_primitive_example(t)
 
-    if type_hint is str:
-        return "example"
-    if type_hint is int:
-        return 123
-    if type_hint is float:
-        return 1.23
-    if type_hint is bool:
-        return True
-    if type_hint is type(None):
-        return None
-
     return None
 
 
@@ -169,8 +173,6 @@ def generate_xml_example(
     seen: Optional[set] = None,
 ) -> str:
     """生成 XML 格式的示例对象"""
-    from typing import get_origin, get_args, Union as TypingUnion
-
     if seen is None:
         seen = set()
 
@@ -189,23 +191,11 @@ def generate_xml_example(
         elements = []
         model_fields = getattr(type_hint, "model_fields", {})
 
-        try:
-            from pydantic import PydanticUndefined
-        except ImportError:
-            PydanticUndefined = type("PydanticUndefined", (), {})
-
         for field_name, field in model_fields.items():
             ann = getattr(field, "annotation", Any)
             default = getattr(field, "default", ...)
 
-            has_default = (
-                default is not ...
-                and default is not PydanticUndefined
-                and not (
-                    hasattr(type(default), "__name__")
-                    and "PydanticUndefined" in str(type(default))
-                )
-            )
+            has_default = default is not ... and default is not PydanticUndefined
 
             if has_default:
                 value = default
@@ -241,7 +231,7 @@ def generate_xml_example(
     args = get_args(type_hint)
 
     # List
-    if origin in (list, List):
+    if origin is list:
         item_t = args[0] if args else Any
         item_xml = generate_xml_example(item_t, depth + 1, max_depth, seen)
         # 提取 item 的内容（去掉可能的根标签）
@@ -258,7 +248,7 @@ def generate_xml_example(
         return f"<{root_name}>\n  <item>{item_content}</item>\n  <item>{item_content}</item>\n</{root_name}>"
 
     # Dict
-    if origin in (dict, Dict):
+    if origin is dict:
         val_t = args[1] if len(args) >= 2 else Any
         val_xml = generate_xml_example(val_t, depth + 1, max_depth, seen)
         if val_xml.startswith("<") and ">" in val_xml:
@@ -274,7 +264,7 @@ def generate_xml_example(
         return f"<{root_name}>\n  <key>example_key</key>\n  <value>{val_content}</value>\n</{root_name}>"
 
     # Union / Optional
-    if origin is TypingUnion:
+    if origin is Union or origin is UnionType:
         for t in args:
             if t is not type(None):
                 return generate_xml_example(t, depth + 1, max_depth, seen)
@@ -417,8 +407,6 @@ def _convert_string_to_type(text: str) -> Any:
 
 def dict_to_pydantic(data: Dict[str, Any], model_class: Type[BaseModel]) -> BaseModel:
     """将字典转换为 Pydantic 模型实例"""
-    from typing import List as TypingList
-    
     # 如果数据是单个值（从 _text 提取），需要包装
     if not isinstance(data, dict):
         # 尝试直接验证
@@ -452,7 +440,7 @@ def dict_to_pydantic(data: Dict[str, Any], model_class: Type[BaseModel]) -> Base
             field_type = field_annotations.get(key)
             if field_type:
                 origin = get_origin(field_type)
-                if origin in (list, TypingList):
+                if origin is list:
                     # 列表类型
                     args = get_args(field_type)
                     item_type = args[0] if args else Any
@@ -508,7 +496,7 @@ def dict_to_pydantic(data: Dict[str, Any], model_class: Type[BaseModel]) -> Base
             # 先检查是否为列表类型（{'item': [...]} 格式）
             if field_type:
                 origin = get_origin(field_type)
-                if origin in (list, TypingList) and "item" in value and isinstance(value["item"], list):
+                if origin is list and "item" in value and isinstance(value["item"], list):
                     # 处理 {'item': [...]} 格式的列表
                     item_list = value["item"]
                     args = get_args(field_type)
@@ -535,7 +523,7 @@ def dict_to_pydantic(data: Dict[str, Any], model_class: Type[BaseModel]) -> Base
             if field_type:
                 # 处理 Optional 类型
                 origin = get_origin(field_type)
-                if origin is Union:
+                if origin is Union or origin is UnionType:
                     args = get_args(field_type)
                     non_none_types = [t for t in args if t is not type(None)]
                     if non_none_types:
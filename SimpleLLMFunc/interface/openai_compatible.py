@@ -17,12 +17,14 @@ from SimpleLLMFunc.logger import (
     get_location,
     get_current_trace_id,
     push_debug,
+    is_debug_enabled,
 )
 from SimpleLLMFunc.logger.logger import (
     push_critical,
     get_current_context_attribute,
     set_current_context_attribute,
 )
+from SimpleLLMFunc.utils import json_utils
 
 
 class OpenAICompatible(LLM_Interface):
@@ -383,11 +385,12 @@ class OpenAICompatible(LLM_Interface):
                     raise Exception("Rate limit: 令牌桶获取令牌超时")
 
                 self.key_pool.increment_task_count(key)
-                data = json.dumps(messages, ensure_ascii=False, indent=4)
-                push_debug(
-                    f"OpenAICompatible::chat: {self.model_name} request with API key: {key}, and message: {data}",
-                    location=get_location(),
-                )
+                if is_debug_enabled():
+                    data = json_utils.dumps(messages, indent=True)
+                    push_debug(
+                        f"OpenAICompatible::chat: {self.model_name} request with API key: {key}, and message: {data}",
+                        location=get_location(),
+                    )
                 response: ChatCompletion = await client.chat.completions.create(  # type: ignore
                     messages=messages,  # type: ignore
                     model=self.model_name,
@@ -488,11 +491,12 @@ class OpenAICompatible(LLM_Interface):
                     raise Exception("Rate limit: 令牌桶获取令牌超时")
 
                 self.key_pool.increment_task_count(key)
-                data = json.dumps(messages, ensure_ascii=False, indent=4)
-                push_debug(
-                    f"OpenAICompatible::chat_stream: {self.model_name} request with API key: {key}, and message: {data}",
-                    location=get_location(),
-                )
+                if is_debug_enabled():
+                    data = json_utils.dumps(messages, indent=True)
+                    push_debug(
+                        f"OpenAICompatible::chat_stream: {self.model_name} request with API key: {key}, and message: {data}",
+                        location=get_location(),
+                    )
 
                 request_kwargs = dict(kwargs)
                 auto_stream_options_added = False
@@ -29,6 +29,7 @@ from SimpleLLMFunc.interface.token_bucket import rate_limit_manager
 from SimpleLLMFunc.logger import (
     get_current_trace_id,
     get_location,
+    is_debug_enabled,
     push_debug,
     push_error,
     push_warning,
@@ -38,6 +39,7 @@ from SimpleLLMFunc.logger.logger import (
     push_critical,
     set_current_context_attribute,
 )
+from SimpleLLMFunc.utils import json_utils
 
 
 _RESPONSES_TOOL_HIDDEN_PROPERTIES = {"event_emitter"}
@@ -641,11 +643,12 @@ class OpenAIResponsesCompatible(LLM_Interface):
                     raise Exception("Rate limit: 令牌桶获取令牌超时")
 
                 self.key_pool.increment_task_count(key)
-                data = json.dumps(list(messages), ensure_ascii=False, indent=4)
-                push_debug(
-                    f"OpenAIResponsesCompatible::chat: {self.model_name} request with API key: {key}, and message: {data}",
-                    location=get_location(),
-                )
+                if is_debug_enabled():
+                    data = json_utils.dumps(list(messages), indent=True)
+                    push_debug(
+                        f"OpenAIResponsesCompatible::chat: {self.model_name} request with API key: {key}, and message: {data}",
+                        location=get_location(),
+                    )
                 request_kwargs = self._build_request_kwargs(
                     messages=messages, kwargs=kwargs
                 )
@@ -711,11 +714,12 @@ class OpenAIResponsesCompatible(LLM_Interface):
                     raise Exception("Rate limit: 令牌桶获取令牌超时")
 
                 self.key_pool.increment_task_count(key)
-                data = json.dumps(list(messages), ensure_ascii=False, indent=4)
-                push_debug(
-                    f"OpenAIResponsesCompatible::chat_stream: {self.model_name} request with API key: {key}, and message: {data}",
-                    location=get_location(),
-                )
+                if is_debug_enabled():
+                    data = json_utils.dumps(list(messages), indent=True)
+                    push_debug(
+                        f"OpenAIResponsesCompatible::chat_stream: {self.model_name} request with API key: {key}, and message: {data}",
+                        location=get_location(),
+                    )
                 request_kwargs = self._build_request_kwargs(
                     messages=messages, kwargs=kwargs
                 )
@@ -578,7 +578,6 @@ def llm_chat(
                 )
 
         signature_meta = inspect.signature(func)
-        docstring = func.__doc__ or ""
         func_name = func.__name__
 
         resolved_default_self_reference_key: Optional[str] = None
@@ -981,10 +980,7 @@ def llm_chat(
                             previous_runtime_toolkit
                         )
 
-        # Preserve original function metadata
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
-        wrapper.__annotations__ = func.__annotations__
+        # @wraps 已复制 __name__/__doc__/__annotations__ 等元数据并设置 __wrapped__
         wrapper.__signature__ = signature_meta  # type: ignore
         setattr(wrapper, _AGENT_TEMPLATE_PARAMS_SUPPORT_ATTR, True)
 
@@ -151,8 +151,6 @@ def llm_function(
         Callable[..., Awaitable[T]], Callable[..., AsyncGenerator[ReactOutput, None]]
     ]:
         signature = inspect.signature(func)
-        docstring = func.__doc__ or ""
-        func_name = func.__name__
 
         # 统一的内部执行逻辑
         # 使用闭包变量来传递解析后的结果（避免重复解析）
@@ -290,10 +288,7 @@ def llm_function(
                 async for output in _execute_function_with_events(*args, **kwargs):
                     yield output
 
-            # Preserve original function metadata
-            async_wrapper_event.__name__ = func_name
-            async_wrapper_event.__doc__ = docstring
-            async_wrapper_event.__annotations__ = func.__annotations__
+            # @wraps 已复制函数元数据，这里只补充预先解析的签名
             setattr(async_wrapper_event, "__signature__", signature)
 
             return cast(
@@ -313,10 +308,7 @@ def llm_function(
                 else:
                     raise ValueError("No response received from LLM")
 
-        # Preserve original function metadata
-        async_wrapper.__name__ = func_name
-        async_wrapper.__doc__ = docstring
-        async_wrapper.__annotations__ = func.__annotations__
+        # @wraps 已复制函数元数据，这里只补充预先解析的签名
         setattr(async_wrapper, "__signature__", signature)
 
         return cast(Callable[..., Awaitable[T]], async_wrapper)
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, AsyncGenerator, Dict, List, Literal, Tuple
 
 from SimpleLLMFunc.base.post_process import (
     extract_content_from_response,
     extract_content_from_stream_response,
 )
-from SimpleLLMFunc.logger import app_log
+from SimpleLLMFunc.logger import app_log, is_info_enabled
 from SimpleLLMFunc.logger.logger import get_location
 from SimpleLLMFunc.type import HistoryList, MessageList
+from SimpleLLMFunc.utils import json_utils
 
 
 def extract_stream_response_content(chunk: Any, func_name: str) -> str:
@@ -50,12 +50,13 @@ async def process_chat_response_stream(
         # 更新当前消息为最新版本（包含工具调用结果）
         current_messages = updated_messages
         
-        # 记录响应日志
-        app_log(
-            f"LLM Chat '{func_name}' received response:"
-            f"\n{json.dumps(response, default=str, ensure_ascii=False, indent=2)}",
-            location=get_location(),
-        )
+        # 记录响应日志（流式模式下每个 chunk 都会执行，日志关闭时跳过序列化）
+        if is_info_enabled():
+            app_log(
+                f"LLM Chat '{func_name}' received response:"
+                f"\n{json_utils.dumps(response, indent=True, default=str)}",
+                location=get_location(),
+            )
 
         # 处理单个响应
         content = process_single_chat_response(
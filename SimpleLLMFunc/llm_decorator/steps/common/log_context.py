@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from contextlib import asynccontextmanager
 from typing import Any, AsyncContextManager, Dict, AsyncGenerator, Optional
 
@@ -13,13 +12,16 @@ from SimpleLLMFunc.observability.langfuse_client import (
     set_langfuse_trace_context,
 )
 
-from SimpleLLMFunc.logger import app_log, async_log_context
+from SimpleLLMFunc.logger import app_log, async_log_context, is_info_enabled
 from SimpleLLMFunc.logger.logger import get_location
+from SimpleLLMFunc.utils import json_utils
 
 
 def log_function_call(func_name: str, arguments: Dict[str, Any]) -> None:
     """记录函数调用日志"""
-    args_str = json.dumps(arguments, default=str, ensure_ascii=False, indent=4)
+    if not is_info_enabled():
+        return
+    args_str = json_utils.dumps(arguments, indent=True, default=str)
     app_log(
         f"Async LLM function '{func_name}' called with arguments: {args_str}",
         location=get_location(),
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import inspect
 import uuid
+import weakref
 from typing import Any, Callable, Dict, Optional, Tuple, get_type_hints
 
 from SimpleLLMFunc.logger.logger import get_current_trace_id
@@ -15,10 +16,16 @@ def extract_template_params(kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return kwargs.pop("_template_params", None)
 
 
-def extract_function_metadata(
-    func: Callable,
-) -> Tuple[inspect.Signature, Dict[str, Any], Any, str, str]:
-    """提取函数的元数据"""
+_FunctionMetadata = Tuple[inspect.Signature, Dict[str, Any], Any, str, str]
+
+# 签名与类型注解在装饰后不会变化，按函数缓存，避免每次调用都重新解析
+_FUNCTION_METADATA_CACHE: "weakref.WeakKeyDictionary[Callable, _FunctionMetadata]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _inspect_function(func: Callable) -> _FunctionMetadata:
+    """解析函数签名、类型注解与文档字符串"""
     signature = inspect.signature(func)
     type_hints = get_type_hints(func)
     return_type = type_hints.get("return")
@@ -28,6 +35,21 @@ def extract_function_metadata(
     return signature, type_hints, return_type, docstring, func_name
 
 
+def extract_function_metadata(func: Callable) -> _FunctionMetadata:
+    """提取函数的元数据（按函数缓存）"""
+    try:
+        return _FUNCTION_METADATA_CACHE[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # 不支持弱引用的可调用对象不缓存
+        return _inspect_function(func)
+
+    metadata = _inspect_function(func)
+    _FUNCTION_METADATA_CACHE[func] = metadata
+    return metadata
+
+
 def generate_trace_id(func_name: str) -> str:
     """生成唯一的追踪 ID"""
     context_trace_id = get_current_trace_id()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import (
     Any,
     AsyncGenerator,
@@ -19,7 +18,7 @@ from SimpleLLMFunc.base.ReAct import execute_llm
 from SimpleLLMFunc.base.post_process import extract_content_from_response
 from SimpleLLMFunc.hooks.abort import AbortSignal
 from SimpleLLMFunc.interface.llm_interface import LLM_Interface
-from SimpleLLMFunc.logger import push_debug, push_error, push_warning
+from SimpleLLMFunc.logger import is_debug_enabled, push_debug, push_error, push_warning
 from SimpleLLMFunc.logger.logger import get_location, get_current_context_attribute
 from SimpleLLMFunc.logger.context_manager import get_current_trace_id
 from SimpleLLMFunc.type import MessageList, ToolDefinitionList
@@ -33,7 +32,7 @@ from SimpleLLMFunc.hooks.stream import (
 
 
 from SimpleLLMFunc.tool import Tool
-from SimpleLLMFunc.utils import get_last_item_of_async_generator
+from SimpleLLMFunc.utils import get_last_item_of_async_generator, json_utils
 from SimpleLLMFunc.llm_decorator.utils import process_tools
 
 
@@ -262,10 +261,10 @@ async def execute_react_loop(
                         last_response = output.response
 
             # 记录最终响应
-            if last_response:
+            if last_response and is_debug_enabled():
                 push_debug(
                     f"Async LLM function '{func_name}' received response "
-                    f"{json.dumps(last_response, default=str, ensure_ascii=False, indent=2)}",
+                    f"{json_utils.dumps(last_response, indent=True, default=str)}",
                     location=get_location(),
                 )
 
@@ -316,10 +315,11 @@ async def execute_react_loop(
             )
 
         # 6. 记录最终响应
-        push_debug(
-            f"Async LLM function '{func_name}' received response "
-            f"{json.dumps(final_response, default=str, ensure_ascii=False, indent=2)}",
-            location=get_location(),
-        )
+        if is_debug_enabled():
+            push_debug(
+                f"Async LLM function '{func_name}' received response "
+                f"{json_utils.dumps(final_response, indent=True, default=str)}",
+                location=get_location(),
+            )
 
         return final_response
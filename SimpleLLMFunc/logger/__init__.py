@@ -12,6 +12,8 @@ from .logger import (
     push_critical,
     push_info,
     push_debug,
+    is_debug_enabled,
+    is_info_enabled,
     get_location,
     LogLevel,
     get_logger,
@@ -26,18 +28,8 @@ from .logger import (
 
 _log_level = logger_config.LOG_LEVEL.upper()
 
-
-# 日志级别映射
-_log_level_map = {
-    "DEBUG": LogLevel.DEBUG,
-    "INFO": LogLevel.INFO,
-    "WARNING": LogLevel.WARNING,
-    "ERROR": LogLevel.ERROR,
-    "CRITICAL": LogLevel.CRITICAL,
-}
-
 # 将字符串级别转换为枚举
-console_level = _log_level_map.get(_log_level, LogLevel.INFO)
+console_level = LogLevel.__members__.get(_log_level, LogLevel.INFO)
 
 # 初始化全局单例日志器
 GLOBAL_LOGGER = setup_logger(
@@ -61,6 +53,8 @@ __all__ = [
     "push_critical",
     "push_info",
     "push_debug",
+    "is_debug_enabled",
+    "is_info_enabled",
     "get_location",
     "log_context",
     "async_log_context",
@@ -5,20 +5,29 @@
 这是日志系统的核心部分，提供了所有主要的日志操作接口。
 """
 
+import atexit
 import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
-from .context_manager import _merge_context, get_current_trace_id
+from .context_manager import DEFAULT_TRACE_ID, _log_context
 from .formatters import ConsoleFormatter, JsonFormatter
+from .handlers import InProcessQueueHandler, PeriodicFlushMemoryHandler
 from .types import LogLevel
-from .utils import get_location
+from .utils import LocationFilter
 from .logger_config import logger_config
 
 
 # 全局日志器对象和处理器
 _logger: Optional[logging.Logger] = None
+_listener: Optional[QueueListener] = None
+
+# 既没有上下文也没有额外字段时所有记录共享的 extra（makeRecord 只读取它）
+_EMPTY_EXTRA: Dict[str, Any] = {"trace_id": DEFAULT_TRACE_ID, "location": None}
 
 
 def setup_logger(
@@ -62,8 +71,10 @@ def setup_logger(
         - 如果日志器已存在，返回现有日志器
         - 自动创建日志目录
         - 设置独立的控制台和文件处理器
+        - 控制台输出保持同步，保证与 print、TUI 输出和异常堆栈的顺序一致
+        - 文件写入（包括轮转检查）由后台线程完成，调用方只负责把记录放入队列
     """
-    global _logger
+    global _logger, _listener
 
     # 如果日志器已存在，返回现有日志器
     if _logger is not None:
@@ -78,22 +89,26 @@ def setup_logger(
 
     # 创建logger
     logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG)  # 设置为最低级别，让handlers决定过滤
+    # 设置为各handler中的最低级别，使 isEnabledFor 能在构造消息前就跳过无人接收的日志
+    logger.setLevel(min(console_level, file_level))
     logger.propagate = False  # 不传播到父logger
 
     # 清除任何现有的处理器
     if logger.handlers:
         logger.handlers.clear()
 
+    # 位置信息只在记录真正被某个处理器接收时才计算
+    location_filter = LocationFilter()
+
     # 配置控制台处理器
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, console_level.name))
+    console_handler.setLevel(console_level)
     console_format = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
     console_formatter = ConsoleFormatter(
         use_color=use_color, format_string=console_format
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.addFilter(location_filter)
 
     # 配置文件处理器
     log_path = os.path.join(log_dir, log_file)
@@ -106,25 +121,47 @@ def setup_logger(
         file_formatter = logging.Formatter(file_format)  # type: ignore[assignment]
 
     # 使用标准的旋转文件处理器
-    from logging.handlers import RotatingFileHandler
     file_handler = RotatingFileHandler(
         filename=log_path,
         maxBytes=max_file_size,
         backupCount=backup_count,
         encoding="utf-8",
     )
-    file_handler.setLevel(getattr(logging, file_level.name))
+    file_handler.setLevel(file_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler.addFilter(location_filter)
+
+    # 文件写入先经过内存缓冲，批量落盘；ERROR及以上级别会立即刷新
+    buffered_file_handler = PeriodicFlushMemoryHandler(
+        capacity=512,
+        target=file_handler,
+        flushLevel=logging.ERROR,
+    )
+    buffered_file_handler.setLevel(file_level)
+    atexit.register(buffered_file_handler.close)
+
+    # 控制台处理器直接挂载在日志器上同步输出；
+    # 文件写入（包括轮转检查）经由队列在后台线程中串行完成
+    logger.addHandler(console_handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = InProcessQueueHandler(log_queue)
+    queue_handler.setLevel(file_level)
+    logger.addHandler(queue_handler)
+    listener = QueueListener(
+        log_queue, buffered_file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # atexit 按注册的逆序执行：先停止监听线程排空队列，再刷新文件缓冲
+    atexit.register(listener.stop)
 
     # 缓存对象
     _logger = logger
+    _listener = listener
 
     # 记录初始化日志
-    location = get_location()
     logger.info(
         f"Logger initialized (dir={log_dir}, file={log_file})",
-        extra={"trace_id": "init", "location": location},
+        extra={"trace_id": "init"},
     )
 
     return logger
@@ -150,12 +187,42 @@ def get_logger() -> logging.Logger:
     return _logger
 
 
+def is_debug_enabled() -> bool:
+    """
+    判断DEBUG级别的日志是否会被任何处理器接收
+
+    用于在构造开销较大的调试消息（例如序列化整个消息列表）之前提前判断，
+    避免在生产环境的INFO级别下做无用功。
+
+    Returns:
+        如果DEBUG日志会被记录返回True，否则返回False
+
+    Example:
+        >>> if is_debug_enabled():
+        ...     push_debug(f"messages: {json.dumps(messages)}")
+    """
+    return get_logger().isEnabledFor(logging.DEBUG)
+
+
+def is_info_enabled() -> bool:
+    """
+    判断INFO级别的日志是否会被任何处理器接收
+
+    与 is_debug_enabled 相同，用于跳过 app_log / push_info 中开销较大的消息构造。
+
+    Returns:
+        如果INFO日志会被记录返回True，否则返回False
+    """
+    return get_logger().isEnabledFor(logging.INFO)
+
+
 def _log_message(
     level: int,
     message: str,
     trace_id: str = "",
     location: Optional[str] = None,
     exc_info: bool = False,
+    stacklevel: int = 1,
     **kwargs: Any,
 ) -> None:
     """
@@ -165,20 +232,25 @@ def _log_message(
         level: 日志级别（logging.DEBUG, logging.INFO等）
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则由处理器上的 LocationFilter 按需生成
         exc_info: 是否包含异常信息
+        stacklevel: 相对于本函数调用者的栈深度，用于让记录的文件名和行号指向真正的调用方
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Note:
         - 自动处理trace_id的合并
-        - 自动获取代码位置
+        - 代码位置来自调用者的帧信息，不再额外遍历调用栈
         - 支持额外字段的传递
     """
     logger = get_logger()
-    location = location or get_location()
 
-    # 获取上下文中的trace_id
-    context_trace_id = get_current_trace_id()
+    # 没有处理器会接收该级别时，直接跳过上下文合并和记录构造
+    if not logger.isEnabledFor(level):
+        return
+
+    # 获取上下文及其中的trace_id
+    context = _log_context.get()
+    context_trace_id = context.get("trace_id", DEFAULT_TRACE_ID)
 
     # 处理trace_id：如果同时有上下文trace_id和显式传递的trace_id，则通过下划线连接它们
     if context_trace_id and trace_id:
@@ -186,10 +258,33 @@ def _log_message(
     elif not trace_id and context_trace_id:
         trace_id = context_trace_id
 
-    # 合并上下文和额外参数
-    extra = _merge_context({"trace_id": trace_id, "location": location, **kwargs})
-
-    logger.log(level, message, exc_info=exc_info, extra=extra)
+    # 合并上下文和额外参数，常见的无上下文、无额外字段情况直接复用共享字典
+    if context or trace_id or location is not None or kwargs:
+        extra = {**context, "trace_id": trace_id, "location": location, **kwargs}
+    else:
+        extra = _EMPTY_EXTRA
+
+    # 直接取调用者的帧构造记录，跳过 Logger._log 中 findCaller 的逐帧遍历
+    try:
+        frame = sys._getframe(stacklevel)
+        code = frame.f_code
+        pathname, lineno, func = code.co_filename, frame.f_lineno, code.co_name
+        del frame
+    except ValueError:
+        pathname, lineno, func = "(unknown file)", 0, "(unknown function)"
+
+    record = logger.makeRecord(
+        logger.name,
+        level,
+        pathname,
+        lineno,
+        message,
+        (),
+        sys.exc_info() if exc_info else None,
+        func,
+        extra,
+    )
+    logger.handle(record)
 
 
 def push_debug(
@@ -201,13 +296,13 @@ def push_debug(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Example:
         >>> push_debug("This is a debug message", user_id="12345")
     """
-    _log_message(logging.DEBUG, message, trace_id, location, **kwargs)
+    _log_message(logging.DEBUG, message, trace_id, location, stacklevel=2, **kwargs)
 
 
 def push_info(
@@ -219,13 +314,13 @@ def push_info(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Example:
         >>> push_info("User login successful", user_id="12345", action="login")
     """
-    _log_message(logging.INFO, message, trace_id, location, **kwargs)
+    _log_message(logging.INFO, message, trace_id, location, stacklevel=2, **kwargs)
 
 
 def push_warning(
@@ -237,13 +332,15 @@ def push_warning(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Example:
         >>> push_warning("Configuration file not found, using defaults")
     """
-    _log_message(logging.WARNING, message, trace_id, location, **kwargs)
+    _log_message(
+        logging.WARNING, message, trace_id, location, stacklevel=2, **kwargs
+    )
 
 
 def push_error(
@@ -259,7 +356,7 @@ def push_error(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         exc_info: 是否包含异常信息，默认为False
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
@@ -269,7 +366,9 @@ def push_error(
         ... except Exception as e:
         ...     push_error("Operation failed", error=str(e), exc_info=True)
     """
-    _log_message(logging.ERROR, message, trace_id, location, exc_info, **kwargs)
+    _log_message(
+        logging.ERROR, message, trace_id, location, exc_info, stacklevel=2, **kwargs
+    )
 
 
 def push_critical(
@@ -285,14 +384,22 @@ def push_critical(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         exc_info: 是否包含异常信息，默认为True
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Example:
         >>> push_critical("System is shutting down due to critical error")
     """
-    _log_message(logging.CRITICAL, message, trace_id, location, exc_info, **kwargs)
+    _log_message(
+        logging.CRITICAL,
+        message,
+        trace_id,
+        location,
+        exc_info,
+        stacklevel=2,
+        **kwargs,
+    )
 
 
 def app_log(
@@ -307,10 +414,10 @@ def app_log(
     Args:
         message: 日志消息
         trace_id: 跟踪ID，用于关联相关日志
-        location: 代码位置，如不提供则自动获取
+        location: 代码位置，如不提供则使用调用处的文件名、函数名和行号
         **kwargs: 额外的键值对，将作为字段添加到日志中
 
     Example:
         >>> app_log("Application started successfully", version="1.0.0")
     """
-    push_info(message, trace_id, location, **kwargs)
+    _log_message(logging.INFO, message, trace_id, location, stacklevel=2, **kwargs)
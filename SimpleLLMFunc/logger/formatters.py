@@ -5,12 +5,14 @@
 支持JSON格式化和控制台彩色输出格式化。
 """
 
-import json
 import logging
 from logging import LogRecord
 import sys
+import time
 from typing import Optional
 
+from SimpleLLMFunc.utils import json_utils
+
 
 class JsonFormatter(logging.Formatter):
     """
@@ -100,13 +102,13 @@ class JsonFormatter(logging.Formatter):
             } and not key.startswith("_"):
                 try:
                     # 尝试JSON序列化，确保值可序列化
-                    json.dumps(value)
+                    json_utils.dumps(value)
                     log_data[key] = value
                 except (TypeError, OverflowError):
                     # 如果不可序列化，转换为字符串
                     log_data[key] = str(value)
 
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return json_utils.dumps(log_data, default=str)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -138,6 +140,8 @@ class ConsoleFormatter(logging.Formatter):
 
     SUPPORTTED_EXTRA_INFO = ["trace_id", "location", "input_tokens", "output_tokens"]
 
+    _BORDER = "=" * 30
+
     def __init__(
         self, use_color: bool = True, format_string: Optional[str] = None
     ) -> None:
@@ -158,6 +162,49 @@ class ConsoleFormatter(logging.Formatter):
         super().__init__(format_string)
         self.use_color = use_color and sys.stdout.isatty()
 
+        # 预先拼好每个级别的输出前缀（边框 + 颜色码）和颜色重置码，format 时直接查表
+        if self.use_color:
+            reset = self.COLORS["RESET"]
+            self._level_prefixes = {
+                levelname: f"{self._BORDER}\n{color}"
+                for levelname, color in self.COLORS.items()
+            }
+            self._default_prefix = f"{self._BORDER}\n{reset}"
+            self._color_reset = reset
+        else:
+            self._level_prefixes = {}
+            self._default_prefix = f"{self._BORDER}\n"
+            self._color_reset = ""
+
+        # 最近一次格式化的整秒时间戳及其字符串，同一秒内的记录只需补上毫秒
+        self._cached_second: Optional[int] = None
+        self._cached_second_str = ""
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        格式化记录的创建时间，输出与 logging.Formatter 默认格式一致
+
+        Args:
+            record: 日志记录对象
+            datefmt: 自定义时间格式，提供时直接交给父类处理
+
+        Returns:
+            形如 "2024-01-01 12:00:00,123" 的时间字符串
+
+        Note:
+            突发日志中大量记录落在同一秒内，因此按整秒缓存 strftime 的结果
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second_str = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_second_str, record.msecs)
+
     def format(self, record: LogRecord) -> str:
         """
         格式化日志记录为控制台输出格式
@@ -177,21 +224,18 @@ class ConsoleFormatter(logging.Formatter):
         formatted = super().format(record)
 
         # 应用颜色（如果启用）
-        if self.use_color:
-            levelname = record.levelname
-            color = self.COLORS.get(levelname, self.COLORS["RESET"])
-            formatted = f"{color}{formatted}{self.COLORS['RESET']}"
+        prefix = self._level_prefixes.get(record.levelname, self._default_prefix)
+        formatted = f"{prefix}{formatted}{self._color_reset}"
 
-        # 添加各类extra info（如果存在）
-        extra_info = []
-        for attr in self.SUPPORTTED_EXTRA_INFO:
-            attr_value = getattr(record, attr, "")
-            if hasattr(record, attr) and attr_value:
-                extra_info.append(f"{attr}={attr_value}")
+        # 添加各类extra info（如果存在），直接读取记录的属性字典，每个字段只查找一次
+        record_dict = record.__dict__
+        extra_info = [
+            f"{attr}={attr_value}"
+            for attr in self.SUPPORTTED_EXTRA_INFO
+            if (attr_value := record_dict.get(attr))
+        ]
 
         if extra_info:
             formatted += "\n" + "\n".join(extra_info)
 
-        formatted = "=" * 30 + "\n" + formatted + "\n" + "=" * 30
-
-        return formatted
+        return f"{formatted}\n{self._BORDER}"
@@ -0,0 +1,95 @@
+"""
+日志处理器模块
+
+本模块包含了日志系统使用的自定义处理器。日志记录在调用线程中只会被放入队列，
+真正的格式化和磁盘/控制台写入由后台线程完成，避免阻塞异步事件循环。
+"""
+
+import copy
+import logging
+import threading
+from logging.handlers import MemoryHandler, QueueHandler
+from typing import Optional
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    进程内队列处理器
+
+    标准库的 QueueHandler 会在入队前完整格式化消息并丢弃异常信息，以便记录可以被
+    序列化后跨进程传递。本模块的队列只在同一进程内使用，因此这里只合并消息参数，
+    保留 exc_info 等字段交给后台线程中的真实处理器去格式化，既减少了调用线程上的
+    格式化开销，也让 JsonFormatter 仍能输出结构化的异常信息。
+
+    Example:
+        >>> log_queue = queue.SimpleQueue()
+        >>> logger.addHandler(InProcessQueueHandler(log_queue))
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        准备入队的日志记录
+
+        Args:
+            record: 原始日志记录
+
+        Returns:
+            消息参数已合并的记录副本，避免入队后参数对象被修改而影响输出
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class PeriodicFlushMemoryHandler(MemoryHandler):
+    """
+    带定时刷新的缓冲处理器
+
+    记录先缓存在内存中，满足以下任一条件时才批量写入目标处理器：
+    缓冲区已满、记录级别不低于 flushLevel、或距离上次刷新超过 flush_interval 秒。
+    这样突发的大量调试日志可以合并成少量写入，而错误日志仍然会立即落盘。
+
+    Args:
+        capacity: 缓冲区可容纳的记录数量
+        target: 真正执行写入的处理器
+        flushLevel: 触发立即刷新的最低级别，默认为ERROR
+        flush_interval: 定时刷新的间隔（秒），默认为1秒
+
+    Example:
+        >>> buffered = PeriodicFlushMemoryHandler(512, target=file_handler)
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        target: logging.Handler,
+        flushLevel: int = logging.ERROR,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(
+            capacity, flushLevel=flushLevel, target=target, flushOnClose=True
+        )
+        self.flush_interval = flush_interval
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._flush_periodically,
+            name="SimpleLLMFunc-log-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """
+        停止定时刷新线程，并在关闭前写出缓冲区中剩余的记录
+        """
+        self._stop_event.set()
+        flush_thread = self._flush_thread
+        if flush_thread is not None and flush_thread is not threading.current_thread():
+            flush_thread.join()
+        self._flush_thread = None
+        super().close()
@@ -15,6 +15,8 @@ from .core import (
     push_error,
     push_critical,
     app_log,
+    is_debug_enabled,
+    is_info_enabled,
 )
 from .context_manager import (
     log_context,
@@ -36,6 +38,8 @@ __all__ = [
     "push_error",
     "push_critical",
     "app_log",
+    "is_debug_enabled",
+    "is_info_enabled",
     "log_context",
     "async_log_context",
     "get_current_trace_id",
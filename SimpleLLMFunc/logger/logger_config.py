@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
@@ -13,8 +14,19 @@ class LoggerConfig(BaseSettings):
     LOG_DIR: str = "logs"
 
 
+def _has_config_source() -> bool:
+    """是否存在 .env 文件或相关环境变量（环境变量名不区分大小写）"""
+    if os.path.exists(".env"):
+        return True
+    fields = LoggerConfig.model_fields.keys()
+    return any(key.upper() in fields for key in os.environ)
+
+
 @lru_cache
 def get_logger_config() -> LoggerConfig:
+    # 没有任何配置来源时直接使用默认值构造，跳过 pydantic-settings 的读取与校验
+    if not _has_config_source():
+        return LoggerConfig.model_construct()
     return LoggerConfig()
 
 
@@ -4,14 +4,16 @@
 本模块定义了日志系统使用到的所有类型和枚举。
 """
 
-from enum import Enum, auto
+import logging
+from enum import IntEnum
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """
     日志级别枚举
 
     定义了标准的日志级别，用于控制日志的详细程度。
+    枚举值与标准库 logging 的级别数值一致，可直接传给 setLevel 并做整数比较。
 
     Attributes:
         DEBUG: 调试级别，用于开发和调试时的详细信息
@@ -21,8 +23,8 @@ class LogLevel(Enum):
         CRITICAL: 严重错误级别，用于记录严重影响系统运行的错误
     """
 
-    DEBUG = auto()
-    INFO = auto()
-    WARNING = auto()
-    ERROR = auto()
-    CRITICAL = auto()
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    WARNING = logging.WARNING
+    ERROR = logging.ERROR
+    CRITICAL = logging.CRITICAL
@@ -4,9 +4,11 @@
 本模块包含了日志系统使用的各种工具函数，包括位置获取、时间转换等。
 """
 
-import inspect
+import logging
 import os
+import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 
@@ -31,6 +33,17 @@ def convert_float_to_datetime_with_tz(
     return datetime.fromtimestamp(time_float, tz=tz)
 
 
+@lru_cache(maxsize=1024)
+def _format_location(co_filename: str, co_name: str, lineno: int) -> str:
+    """
+    格式化调用位置字符串，同一调用点只格式化一次
+
+    缓存键只使用字符串和行号而不持有代码对象，且容量有限，
+    动态编译的代码（如 REPL 中 exec 的代码）不会因缓存而无法释放。
+    """
+    return f"{os.path.basename(co_filename)}:{co_name}:{lineno}"
+
+
 def _is_logger_module_frame(frame) -> bool:
     """
     检查给定的帧是否属于 SimpleLLMFunc.logger 模块
@@ -46,37 +59,16 @@ def _is_logger_module_frame(frame) -> bool:
     """
     if frame is None:
         return False
-    
-    try:
-        # 方法1: 优先使用模块名检测（最可靠）
-        # 检查模块名是否以 SimpleLLMFunc.logger 开头
-        try:
-            module = inspect.getmodule(frame)
-            if module and hasattr(module, '__name__'):
-                module_name = module.__name__
-                if module_name.startswith('SimpleLLMFunc.logger'):
-                    return True
-        except (AttributeError, TypeError):
-            # 如果无法获取模块信息，继续使用路径检测
-            pass
-        
-        # 方法2: 检查文件路径中是否包含 SimpleLLMFunc/logger/ 目录
-        # 使用更严格的路径匹配，确保只匹配 SimpleLLMFunc 包的 logger 模块
-        frame_info = inspect.getframeinfo(frame)
-        filepath = frame_info.filename
-        
-        # 标准化路径分隔符
-        normalized_path = filepath.replace('\\', '/')
-        
-        # 严格检查：路径中必须包含 SimpleLLMFunc/logger/ 或 SimpleLLMFunc\logger\
-        # 这样可以避免误判其他项目的 logger 模块
-        if '/SimpleLLMFunc/logger/' in normalized_path:
-            return True
-        
-        return False
-    except Exception:
-        # 如果检查过程中出现任何错误，保守地返回 False
-        return False
+
+    # 方法1: 优先使用帧所在模块的名称检测（最可靠）
+    module_name = frame.f_globals.get("__name__")
+    if isinstance(module_name, str) and module_name.startswith("SimpleLLMFunc.logger"):
+        return True
+
+    # 方法2: 检查文件路径中是否包含 SimpleLLMFunc/logger/ 目录
+    # 严格检查路径，避免误判其他项目的 logger 模块
+    normalized_path = frame.f_code.co_filename.replace("\\", "/")
+    return "/SimpleLLMFunc/logger/" in normalized_path
 
 
 def get_location(depth: int = 2) -> str:
@@ -102,35 +94,58 @@ def get_location(depth: int = 2) -> str:
         - depth=2: 调用当前函数的函数（默认）
         - 如果无法获取位置信息，返回"unknown"
         - 当在 logger 模块内部调用时，会自动跳过 logger 模块内的调用栈
+        - 直接读取帧对象而不是通过 inspect 读取源文件，结果按调用点缓存
     """
-    frame = inspect.currentframe()
     try:
-        # 向上追溯调用栈
-        for _ in range(depth):
-            if frame is None:
-                break
-            frame = frame.f_back
+        # sys._getframe(0) 是当前函数，depth 与原先沿 f_back 回溯的步数一致
+        frame = sys._getframe(depth)
+    except ValueError:
+        return "unknown"
 
+    try:
         # 如果是在 logger 模块内部调用（比如从 _log_message 调用），
         # 需要继续向上追溯，跳过所有 logger 模块内的调用
-        if frame:
-            # 如果当前帧还在 logger 模块内，继续向上追溯
-            while frame and _is_logger_module_frame(frame):
-                frame = frame.f_back
-            
-            if frame:
-                frame_info = inspect.getframeinfo(frame)
-                filename = os.path.basename(frame_info.filename)
-                return f"{filename}:{frame_info.function}:{frame_info.lineno}"
-            else:
-                return "unknown"
-        else:
+        while frame is not None and _is_logger_module_frame(frame):
+            frame = frame.f_back
+
+        if frame is None:
             return "unknown"
+
+        code = frame.f_code
+        return _format_location(code.co_filename, code.co_name, frame.f_lineno)
     finally:
         # 删除引用，避免循环引用
         del frame
 
 
+class LocationFilter(logging.Filter):
+    """
+    为日志记录补全代码位置信息的过滤器
+
+    挂载在 handler 上，只有当记录通过了 handler 的级别检查后才会被调用，
+    因此被级别过滤掉的日志不会产生任何位置计算开销。位置信息直接取自
+    logging 模块在创建记录时已经填好的 filename/funcName/lineno，无需再次遍历调用栈。
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.addFilter(LocationFilter())
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        如果记录中没有显式提供 location，则根据记录自身的调用者信息生成
+
+        Args:
+            record: 日志记录对象
+
+        Returns:
+            始终返回 True，不会过滤任何记录
+        """
+        if not getattr(record, "location", None):
+            record.location = f"{record.filename}:{record.funcName}:{record.lineno}"
+        return True
+
+
 def format_extra_fields(record_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     格式化日志记录的额外字段
@@ -11,6 +11,7 @@ from typing import (
     Callable,
     get_type_hints,
     Type,
+    Tuple,
     TypeVar,
     get_origin,
     get_args,
@@ -155,6 +156,7 @@ class Tool(ABC):
             )
         self.func = func
         self.parameters = self._extract_parameters() if func else []
+        self._openai_tool_cache: Optional[Tuple[Any, ...]] = None
 
     def build_system_prompt_injection(
         self,
@@ -426,9 +428,21 @@ class Tool(ABC):
         """
         序列化工具为OpenAI工具格式
 
+        结果按 (name, description, parameters) 缓存，每次 LLM 调用都会序列化工具列表，
+        缓存可以避免重复生成参数的 JSON Schema。返回的字典会被复用，调用方不应修改。
+
         Returns:
             符合OpenAI Function Calling API格式的工具描述字典
         """
+        cached = getattr(self, "_openai_tool_cache", None)
+        if (
+            cached is not None
+            and cached[0] == self.name
+            and cached[1] == self.description
+            and cached[2] is self.parameters
+        ):
+            return cached[3]
+
         properties = {}
         required_params = []
 
@@ -466,6 +480,7 @@ class Tool(ABC):
         if required_params:
             tool_spec["function"]["parameters"]["required"] = required_params  # type: ignore
 
+        self._openai_tool_cache = (self.name, self.description, self.parameters, tool_spec)
         return tool_spec
 
     @staticmethod
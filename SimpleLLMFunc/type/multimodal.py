@@ -19,9 +19,11 @@ def analyze_image(
 ```
 """
 
+from functools import lru_cache
 from typing import Union, List
 from pathlib import Path
 import base64
+import os
 
 
 class Text:
@@ -60,6 +62,23 @@ class ImgUrl:
         return f"ImgUrl({self.url!r}, detail={self.detail!r})"
 
 
+# lru_cache 的 maxsize 只限制条目数，不限制字节数；只缓存不超过该大小的文件，
+# 最坏情况下缓存占用约为 32 * 1 MiB * 4/3 ≈ 43 MiB，更大的文件每次直接读取编码
+_BASE64_CACHE_MAX_FILE_SIZE = 1024 * 1024
+
+
+def _read_file_base64(path: str) -> str:
+    """读取文件并进行base64编码，不经过缓存"""
+    with open(path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _encode_file_base64(path: str, mtime_ns: int, size: int) -> str:
+    """读取文件并进行base64编码；mtime 与 size 参与缓存键，文件变化后自动失效"""
+    return _read_file_base64(path)
+
+
 class ImgPath:
     """本地图片路径类型"""
 
@@ -87,9 +106,19 @@ class ImgPath:
         return f"ImgPath({self.path!r}, detail={self.detail!r})"
 
     def to_base64(self) -> str:
-        """将图片转换为base64编码"""
-        with open(self.path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+        """将图片转换为base64编码，同一文件未修改时复用上次的编码结果"""
+        path = os.fspath(self.path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return _read_file_base64(path)
+        if stat.st_size > _BASE64_CACHE_MAX_FILE_SIZE:
+            return _read_file_base64(path)
+        return _encode_file_base64(path, stat.st_mtime_ns, stat.st_size)
+
+    def to_data_url(self) -> str:
+        """将图片转换为 data URL，复用 to_base64 缓存的编码结果，只拼接前缀"""
+        return f"data:{self.get_mime_type()};base64,{self.to_base64()}"
 
     def get_mime_type(self) -> str:
         """获取图片的MIME类型"""
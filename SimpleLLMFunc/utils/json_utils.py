@@ -0,0 +1,120 @@
+"""JSON 序列化工具
+
+在安装了 orjson（``SimpleLLMFunc[orjson]`` 扩展）时使用它进行序列化与反序列化，
+否则回退到标准库 json。两种实现的输出都保留非ASCII字符（等同于 ``ensure_ascii=False``），
+非有限浮点数都按标准库的方式输出为 ``NaN``/``Infinity``。
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """检查对象中是否包含 NaN 或 Infinity，orjson 会把它们编码为 null"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(
+            _has_non_finite_float(key) or _has_non_finite_float(value)
+            for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in obj)
+    return False
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    将对象序列化为JSON字符串
+
+    Args:
+        obj: 要序列化的对象
+        indent: 是否以两个空格缩进的格式输出，默认为不含多余空白的紧凑格式
+        default: 无法直接序列化的对象的转换函数，语义与 ``json.dumps`` 相同
+
+    Returns:
+        序列化后的JSON字符串
+
+    Raises:
+        TypeError: 对象中包含无法序列化且没有提供 default 的值
+
+    Note:
+        orjson 无法处理的对象（例如超过64位的整数）会回退到标准库重新序列化，
+        因此两种实现接受的输入范围一致。包含 NaN/Infinity 的对象同样回退到标准库，
+        保证两种实现输出相同的文本。
+    """
+    if orjson is not None:
+        # dataclass 与 datetime 交给 default 处理，与标准库的行为保持一致
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        default_has_non_finite = False
+        checked_default = default
+        if default is not None:
+
+            def checked_default(value: Any) -> Any:
+                nonlocal default_has_non_finite
+                result = default(value)
+                if _has_non_finite_float(result):
+                    default_has_non_finite = True
+                return result
+
+        try:
+            encoded = orjson.dumps(obj, default=checked_default, option=option)
+        except TypeError:
+            pass
+        else:
+            # 非有限浮点数只可能被编码成 null，输出中没有 null 时无需检查
+            if b"null" not in encoded or not (
+                default_has_non_finite or _has_non_finite_float(obj)
+            ):
+                return encoded.decode()
+
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    将JSON字符串反序列化为Python对象
+
+    Args:
+        data: JSON字符串或字节串
+
+    Returns:
+        反序列化得到的对象
+
+    Raises:
+        json.JSONDecodeError: 输入不是合法的JSON
+
+    Note:
+        orjson 拒绝而标准库接受的输入（例如 ``NaN``）会回退到标准库解析。
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
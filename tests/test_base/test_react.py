@@ -23,7 +23,7 @@ from SimpleLLMFunc.hooks.events import (
     ReactEndEvent,
     ReActEventType,
 )
-from SimpleLLMFunc.hooks.stream import EventYield
+from SimpleLLMFunc.hooks.stream import EventYield, ResponseYield
 
 
 class TestExecuteLLM:
@@ -204,6 +204,47 @@ class TestExecuteLLM:
 
         assert len(responses) >= 1
 
+    @pytest.mark.asyncio
+    @patch("SimpleLLMFunc.base.ReAct.langfuse_client")
+    @patch("SimpleLLMFunc.base.ReAct.get_current_context_attribute")
+    async def test_execute_streaming_chunks_share_messages_snapshot(
+        self,
+        mock_get_context: MagicMock,
+        mock_langfuse: MagicMock,
+        mock_llm_interface: Any,
+        sample_messages: list,
+    ) -> None:
+        """Stream chunks of one LLM call share a single messages snapshot."""
+        mock_get_context.return_value = "test_func"
+
+        async def stream_generator(**kwargs):
+            for content in ("a", "b", "c"):
+                yield self._make_chunk(content)
+
+        mock_llm_interface.chat_stream = stream_generator
+        mock_observation = MagicMock()
+        mock_observation.__enter__ = MagicMock(return_value=mock_observation)
+        mock_observation.__exit__ = MagicMock(return_value=None)
+        mock_langfuse.start_as_current_observation.return_value = mock_observation
+
+        snapshots = []
+        async for output in execute_llm(
+            llm_interface=mock_llm_interface,
+            messages=sample_messages,
+            tools=None,
+            tool_map={},
+            max_tool_calls=5,
+            stream=True,
+            enable_event=True,
+        ):
+            if isinstance(output, ResponseYield):
+                snapshots.append(output.messages)
+
+        assert len(snapshots) == 3
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert snapshots[0] is not sample_messages
+        assert snapshots[0] == sample_messages
+
     @pytest.mark.asyncio
     @patch("SimpleLLMFunc.base.ReAct.langfuse_client")
     @patch("SimpleLLMFunc.base.ReAct.get_current_context_attribute")
@@ -3,19 +3,111 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
+import threading
+from typing import List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from SimpleLLMFunc.base.tool_call.execution import (
+    _build_multimodal_result_message,
+    _convert_tool_arguments,
     _execute_single_tool_call,
+    _resolve_multimodal_parameters,
     process_tool_calls,
+    process_tool_calls_streaming,
 )
 from SimpleLLMFunc.hooks.abort import AbortSignal
 from SimpleLLMFunc.type.multimodal import ImgPath, ImgUrl, Text
 
 
+class TestConvertToolArguments:
+    """Tests for _convert_tool_arguments function."""
+
+    def test_converts_multimodal_parameters(self) -> None:
+        async def tool(
+            urls: List[ImgUrl], note: Optional[Text], count: int, extra: str
+        ) -> str:
+            return ""
+
+        converted = _convert_tool_arguments(
+            {
+                "urls": ["https://example.com/a.png"],
+                "note": "hello",
+                "count": 1,
+                "extra": "x",
+                "unknown": "y",
+            },
+            tool,
+        )
+
+        assert [url.url for url in converted["urls"]] == ["https://example.com/a.png"]
+        assert isinstance(converted["note"], Text)
+        assert (converted["count"], converted["extra"], converted["unknown"]) == (
+            1,
+            "x",
+            "y",
+        )
+
+    def test_invalid_value_keeps_original(self) -> None:
+        async def tool(url: ImgUrl, urls: Optional[List[ImgUrl]] = None) -> str:
+            return ""
+
+        arguments = {"url": "not-a-url", "urls": None}
+
+        assert _convert_tool_arguments(arguments, tool) == arguments
+
+    def test_signature_resolved_once_per_function(self) -> None:
+        async def tool(note: Text) -> str:
+            return ""
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
+            for _ in range(3):
+                _convert_tool_arguments({"note": "hi"}, tool)
+
+        assert signature.call_count == 1
+
+    def test_unhashable_callable_is_converted_without_cache(self) -> None:
+        class UnhashableTool:
+            __hash__ = None  # type: ignore[assignment]
+            # get_type_hints reads annotations from the instance, so give resolved types
+            __annotations__ = {"note": Text}
+
+            async def __call__(self, note: Text) -> str:
+                return ""
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.push_warning"
+        ) as push_warning:
+            converted = _convert_tool_arguments({"note": "hi"}, UnhashableTool())
+
+        assert isinstance(converted["note"], Text)
+        push_warning.assert_not_called()
+
+
+class TestBuildMultimodalResultMessage:
+    """Tests for _build_multimodal_result_message function."""
+
+    def test_tuple_with_text(self, img_url: ImgUrl) -> None:
+        message = _build_multimodal_result_message("tool", ("caption", img_url))
+
+        assert message is not None
+        assert message["role"] == "user"
+        assert message["content"][0]["text"].endswith("caption")
+        assert message["content"][1]["image_url"]["url"] == img_url.url
+
+    def test_non_image_results_return_none(self, img_url: ImgUrl) -> None:
+        assert _build_multimodal_result_message("tool", {"a": 1}) is None
+        assert _build_multimodal_result_message("tool", "text") is None
+        assert _build_multimodal_result_message("tool", ["caption", img_url]) is None
+        assert _build_multimodal_result_message("tool", (1, img_url)) is None
+
+
 class TestExecuteSingleToolCall:
     """Tests for _execute_single_tool_call function."""
 
@@ -56,6 +148,71 @@ class TestExecuteSingleToolCall:
         assert messages[0]["role"] == "tool"
         assert is_multimodal is False
 
+    @pytest.mark.asyncio
+    async def test_debug_logs_skipped_when_debug_disabled(self) -> None:
+        """Test that debug messages are not built when DEBUG is disabled."""
+        tool_call = {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "test_tool", "arguments": '{"arg": "value"}'},
+        }
+        tool_map = {"test_tool": AsyncMock(return_value={"key": "value"})}
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.is_debug_enabled",
+            return_value=False,
+        ), patch(
+            "SimpleLLMFunc.base.tool_call.execution.push_debug"
+        ) as mock_push_debug:
+            _, messages, _ = await _execute_single_tool_call(tool_call, tool_map)
+
+        mock_push_debug.assert_not_called()
+        assert json.loads(messages[0]["content"]) == {"key": "value"}
+
+    @pytest.mark.asyncio
+    async def test_span_updated_once_on_success(self) -> None:
+        """Test parsed input and output are recorded in a single span update."""
+        tool_call = {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "test_tool", "arguments": '{"arg": "value"}'},
+        }
+        tool_map = {"test_tool": AsyncMock(return_value={"key": "value"})}
+        span = MagicMock()
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.langfuse_client.start_as_current_observation"
+        ) as start_observation:
+            start_observation.return_value.__enter__.return_value = span
+            await _execute_single_tool_call(tool_call, tool_map)
+
+        span.update.assert_called_once_with(
+            input={"arg": "value"}, output={"key": "value"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_span_error_update_includes_parsed_input(self) -> None:
+        """Test tool errors record the parsed input with the error output."""
+        tool_call = {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "test_tool", "arguments": '{"arg": "value"}'},
+        }
+        tool_map = {"test_tool": AsyncMock(side_effect=RuntimeError("boom"))}
+        span = MagicMock()
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.langfuse_client.start_as_current_observation"
+        ) as start_observation:
+            start_observation.return_value.__enter__.return_value = span
+            await _execute_single_tool_call(tool_call, tool_map)
+
+        span.update.assert_called_once()
+        update_kwargs = span.update.call_args.kwargs
+        assert update_kwargs["input"] == {"arg": "value"}
+        assert update_kwargs["level"] == "ERROR"
+        assert update_kwargs["output"]["exception_type"] == "RuntimeError"
+
     @pytest.mark.asyncio
     async def test_execute_img_url_result(self, img_url: ImgUrl) -> None:
         """Test executing tool call with ImgUrl result."""
@@ -92,6 +249,28 @@ class TestExecuteSingleToolCall:
         assert len(messages) == 1
         assert messages[0]["role"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_img_path_encoded_off_event_loop(self, img_path: ImgPath) -> None:
+        """Test ImgPath base64 encoding runs in a worker thread."""
+        tool_call = {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "test_tool", "arguments": "{}"},
+        }
+        tool_map = {"test_tool": AsyncMock(return_value=img_path)}
+        encode_threads: List[int] = []
+        original_to_data_url = ImgPath.to_data_url
+
+        def recording_to_data_url(self: ImgPath) -> str:
+            encode_threads.append(threading.get_ident())
+            return original_to_data_url(self)
+
+        with patch.object(ImgPath, "to_data_url", recording_to_data_url):
+            await _execute_single_tool_call(tool_call, tool_map)
+
+        assert encode_threads
+        assert threading.get_ident() not in encode_threads
+
     @pytest.mark.asyncio
     async def test_execute_tuple_result(self, img_url: ImgUrl) -> None:
         """Test executing tool call with tuple result."""
@@ -110,6 +289,27 @@ class TestExecuteSingleToolCall:
         assert len(messages) == 1
         assert messages[0]["role"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_execute_tuple_img_path_result(self, img_path: ImgPath) -> None:
+        """Test tuple result with ImgPath builds a data URL with the text."""
+        tool_call = {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "test_tool", "arguments": "{}"},
+        }
+        tool_map = {"test_tool": AsyncMock(return_value=("caption", img_path))}
+
+        _, messages, is_multimodal = await _execute_single_tool_call(
+            tool_call, tool_map
+        )
+
+        assert is_multimodal is True
+        text_part, image_part = messages[0]["content"]
+        assert text_part["text"] == "这是工具 'test_tool' 返回的图像文件和说明：caption"
+        assert image_part["image_url"]["url"] == (
+            f"data:image/png;base64,{img_path.to_base64()}"
+        )
+
     @pytest.mark.asyncio
     async def test_execute_tool_not_found(self) -> None:
         """Test executing tool call when tool not found."""
@@ -218,6 +418,28 @@ class TestProcessToolCalls:
         tool_messages = [msg for msg in result if msg["role"] == "tool"]
         assert len(tool_messages) == 2
 
+    @pytest.mark.asyncio
+    async def test_single_tool_call_skips_task_group(self) -> None:
+        """A single tool call is awaited directly without a TaskGroup."""
+        tool_calls = [
+            {
+                "id": "call_123",
+                "type": "function",
+                "function": {"name": "test_tool", "arguments": "{}"},
+            }
+        ]
+        messages = [{"role": "user", "content": "test"}]
+        tool_map = {"test_tool": AsyncMock(return_value="result")}
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution.asyncio.TaskGroup"
+        ) as task_group:
+            result = await process_tool_calls(tool_calls, messages, tool_map)
+
+        task_group.assert_not_called()
+        assert result[-1]["role"] == "tool"
+        assert json.loads(result[-1]["content"]) == "result"
+
     @pytest.mark.asyncio
     async def test_process_empty_tool_calls(self) -> None:
         """Test processing empty tool calls."""
@@ -292,3 +514,136 @@ class TestProcessToolCalls:
 
         assert result == messages
         await asyncio.wait_for(cancel_seen.wait(), timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_process_tool_calls_propagates_original_exception(self) -> None:
+        """Unexpected failures surface as the original exception type."""
+        tool_calls = [
+            {
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "tool1", "arguments": "{}"},
+            }
+        ]
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution._execute_single_tool_call",
+            AsyncMock(side_effect=RuntimeError("boom")),
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                await process_tool_calls(tool_calls, [], {})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_keep_exception_group_as_cause(self) -> None:
+        """The first failure is raised with every failure kept on __cause__."""
+        tool_calls, tool_map = _delayed_tool_calls()
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.execution._execute_single_tool_call",
+            AsyncMock(side_effect=[RuntimeError("first"), ValueError("second")]),
+        ):
+            with pytest.raises(RuntimeError, match="first") as exc_info:
+                await process_tool_calls(tool_calls, [], tool_map)
+
+        group = exc_info.value.__cause__
+        assert isinstance(group, BaseExceptionGroup)
+        assert [str(error) for error in group.exceptions] == ["first", "second"]
+
+
+def _delayed_tool_calls() -> tuple[list[dict], dict]:
+    tool_calls = [
+        {
+            "id": f"call_{name}",
+            "type": "function",
+            "function": {"name": name, "arguments": "{}"},
+        }
+        for name in ("slow", "fast")
+    ]
+
+    async def slow() -> str:
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    async def fast() -> str:
+        return "fast"
+
+    return tool_calls, {"slow": slow, "fast": fast}
+
+
+class TestProcessToolCallsStreaming:
+    """Tests for process_tool_calls_streaming function."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_input_order(self) -> None:
+        tool_calls, tool_map = _delayed_tool_calls()
+
+        ids = [
+            tool_call["id"]
+            async for tool_call, _, _ in process_tool_calls_streaming(
+                tool_calls, tool_map
+            )
+        ]
+
+        assert ids == ["call_slow", "call_fast"]
+
+    @pytest.mark.asyncio
+    async def test_completion_order(self) -> None:
+        tool_calls, tool_map = _delayed_tool_calls()
+
+        results = [
+            (tool_call["id"], json.loads(messages[0]["content"]))
+            async for tool_call, messages, _ in process_tool_calls_streaming(
+                tool_calls, tool_map, preserve_order=False
+            )
+        ]
+
+        assert results == [("call_fast", "fast"), ("call_slow", "slow")]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_running_tools(self) -> None:
+        tool_calls, tool_map = _delayed_tool_calls()
+        cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+
+        tool_map["slow"] = slow
+        stream = process_tool_calls_streaming(
+            tool_calls, tool_map, preserve_order=False
+        )
+        first, _, _ = await stream.__anext__()
+        await stream.aclose()
+
+        assert first["id"] == "call_fast"
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_abort_stops_stream_and_cancels_running_tools(self) -> None:
+        tool_calls, tool_map = _delayed_tool_calls()
+        cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+
+        tool_map["slow"] = slow
+        abort_signal = AbortSignal()
+
+        ids = []
+        async for tool_call, _, _ in process_tool_calls_streaming(
+            tool_calls, tool_map, abort_signal=abort_signal, preserve_order=False
+        ):
+            ids.append(tool_call["id"])
+            abort_signal.abort("user_interrupt")
+
+        assert ids == ["call_fast"]
+        assert cancelled.is_set()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
 from openai.types.chat import ChatCompletion
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
@@ -11,10 +14,14 @@ from openai.types.chat.chat_completion_message_function_tool_call import (
 )
 
 from SimpleLLMFunc.base.tool_call.extraction import (
+    ToolCallAccumulator,
     accumulate_tool_calls_from_chunks,
+    extract_reasoning_details,
+    extract_reasoning_details_from_stream,
     extract_tool_calls,
     extract_tool_calls_from_stream_response,
     parse_tool_call_arguments,
+    repair_and_parse_tool_call_arguments,
     repair_tool_call_arguments,
 )
 
@@ -69,6 +76,19 @@ class TestExtractToolCalls:
         result = extract_tool_calls({})
         assert result == []
 
+    def test_extract_malformed_tool_call(self) -> None:
+        """Test a tool call missing its function yields no tool calls."""
+        message = SimpleNamespace(tool_calls=[SimpleNamespace(id="call_1")])
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        with patch(
+            "SimpleLLMFunc.base.tool_call.extraction.push_error"
+        ) as mock_push_error:
+            result = extract_tool_calls(response)
+
+        assert result == []
+        mock_push_error.assert_called_once()
+
 
 class TestExtractToolCallsFromStreamResponse:
     """Tests for extract_tool_calls_from_stream_response function."""
@@ -227,6 +247,128 @@ class TestAccumulateToolCallsFromChunks:
         assert result[0]["function"]["arguments"] == '{"code":"print(1)"}'
 
 
+class TestToolCallAccumulator:
+    """Tests for ToolCallAccumulator."""
+
+    def test_consume_across_stream_chunks(self) -> None:
+        """Fragments fed one stream chunk at a time merge by index."""
+        accumulator = ToolCallAccumulator()
+        accumulator.consume(
+            [
+                {"index": 0, "id": "call_1", "function": {"name": "tool1"}},
+                {"index": 1, "id": "call_2", "function": {"name": "tool2"}},
+            ]
+        )
+        accumulator.consume([{"index": 0, "function": {"arguments": '{"a": '}}])
+        accumulator.consume([{"index": 1, "function": {"arguments": "{}"}}])
+        accumulator.consume([{"index": 0, "function": {"arguments": "1}"}}])
+
+        result = accumulator.build()
+        assert [call["id"] for call in result] == ["call_1", "call_2"]
+        assert result[0]["type"] == "function"
+        assert result[0]["function"]["arguments"] == '{"a": 1}'
+        assert result[1]["function"]["arguments"] == "{}"
+
+    def test_feed_stream_chunks(self) -> None:
+        """Stream chunks fed directly are extracted and merged."""
+        from openai.types.chat.chat_completion_chunk import (
+            ChatCompletionChunk,
+            Choice as ChunkChoice,
+            ChoiceDelta,
+            ChoiceDeltaToolCall,
+            ChoiceDeltaToolCallFunction,
+        )
+
+        def make_chunk(tool_call: ChoiceDeltaToolCall | None) -> ChatCompletionChunk:
+            delta = ChoiceDelta(
+                content=None if tool_call else "text",
+                role="assistant",
+                tool_calls=[tool_call] if tool_call else None,
+            )
+            return ChatCompletionChunk(
+                id="chunk",
+                choices=[ChunkChoice(delta=delta, finish_reason=None, index=0)],
+                created=0,
+                model="gpt-3.5-turbo",
+                object="chat.completion.chunk",
+            )
+
+        accumulator = ToolCallAccumulator()
+        first = accumulator.feed(
+            make_chunk(
+                ChoiceDeltaToolCall(
+                    index=0,
+                    id="call_1",
+                    type="function",
+                    function=ChoiceDeltaToolCallFunction(name="tool1", arguments='{"a"'),
+                )
+            )
+        )
+        assert accumulator.feed(make_chunk(None)) == []
+        accumulator.feed(
+            make_chunk(
+                ChoiceDeltaToolCall(
+                    index=0, function=ChoiceDeltaToolCallFunction(arguments=": 1}")
+                )
+            )
+        )
+
+        assert first[0]["function"]["name"] == "tool1"
+        result = accumulator.build()
+        assert len(result) == 1
+        assert result[0]["function"]["arguments"] == '{"a": 1}'
+
+
+class TestExtractReasoningDetails:
+    """Tests for reasoning_details extraction helpers."""
+
+    def test_extract_from_message_objects_and_dicts(self) -> None:
+        """Object and dict details are normalized with defaults."""
+        details = [
+            SimpleNamespace(id="r1", format="f", index=0, data="d1"),
+            {"id": "r2", "index": 1, "data": "d2"},
+        ]
+        message = SimpleNamespace(reasoning_details=details)
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        result = extract_reasoning_details(response)
+
+        assert result == [
+            {
+                "id": "r1",
+                "format": "f",
+                "index": 0,
+                "type": "reasoning.encrypted",
+                "data": "d1",
+            },
+            {
+                "id": "r2",
+                "format": "",
+                "index": 1,
+                "type": "reasoning.encrypted",
+                "data": "d2",
+            },
+        ]
+
+    def test_extract_from_stream_dict_delta(self) -> None:
+        """Dict deltas carrying reasoning_details are supported."""
+        delta = {"reasoning_details": [{"id": "r1", "data": "d1"}]}
+        chunk = SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        result = extract_reasoning_details_from_stream(chunk)
+
+        assert [detail["id"] for detail in result] == ["r1"]
+
+    def test_missing_structure_returns_empty(self) -> None:
+        """Responses without choices or details yield no reasoning details."""
+        empty_delta = SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace())])
+
+        assert extract_reasoning_details({}) == []
+        assert extract_reasoning_details(SimpleNamespace(choices=[])) == []
+        assert extract_reasoning_details_from_stream(SimpleNamespace()) == []
+        assert extract_reasoning_details_from_stream(empty_delta) == []
+
+
 class TestToolCallArgumentParsing:
     """Tests for argument parsing and repair helpers."""
 
@@ -239,3 +381,13 @@ class TestToolCallArgumentParsing:
         """Closure parser should parse incomplete streaming argument payloads."""
         parsed = parse_tool_call_arguments('{{"code":"print(', allow_closure=True)
         assert parsed == {"code": "print("}
+
+    def test_repair_and_parse_tool_call_arguments(self) -> None:
+        """Combined helper should return the repaired string with its parse."""
+        repaired, parsed = repair_and_parse_tool_call_arguments('{{"a": 1}')
+        assert repaired == '{"a": 1}'
+        assert parsed == {"a": 1}
+
+        repaired, parsed = repair_and_parse_tool_call_arguments("  [1, 2]  ")
+        assert repaired == "[1, 2]"
+        assert parsed is None
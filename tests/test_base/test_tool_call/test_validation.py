@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -36,6 +37,38 @@ class TestIsValidToolResult:
         """Test list result validation."""
         assert is_valid_tool_result([1, 2, 3]) is True
 
+    def test_scalars_and_flat_containers_skip_encode_probe(self) -> None:
+        """Scalars and flat containers of scalars are accepted without encoding."""
+        with patch(
+            "SimpleLLMFunc.base.tool_call.validation.json_utils.dumps"
+        ) as dumps:
+            for result in (None, True, 3, 2.5, [1, "a", None], {"a": 1, 2: "b"}):
+                assert is_valid_tool_result(result) is True
+        dumps.assert_not_called()
+
+    def test_nested_containers_are_walked_without_encoding(self) -> None:
+        """Nested containers of known types are checked structurally."""
+        with patch(
+            "SimpleLLMFunc.base.tool_call.validation.json_utils.dumps"
+        ) as dumps:
+            assert is_valid_tool_result({"nested": {"a": [1, (2, 3)]}}) is True
+        dumps.assert_not_called()
+
+    def test_unknown_nodes_are_probed(self) -> None:
+        """Only values that cannot be judged by type go through the encoder."""
+        class Label(str):
+            pass
+
+        assert is_valid_tool_result({"a": [Label("x")]}) is True
+        assert is_valid_tool_result({"a": [1, object()]}) is False
+        assert is_valid_tool_result({(1, 2): "tuple key"}) is False
+
+    def test_circular_reference_is_invalid(self) -> None:
+        """Self-referencing containers are rejected instead of looping."""
+        result: list = []
+        result.append(result)
+        assert is_valid_tool_result(result) is False
+
     def test_valid_tuple_with_image(self, img_url: ImgUrl) -> None:
         """Test tuple with image validation."""
         result = ("text", img_url)
@@ -109,3 +142,13 @@ class TestSerializeToolOutputForLangfuse:
         result = serialize_tool_output_for_langfuse(obj)
         assert result == "non-serializable"
 
+    def test_known_valid_skips_serializability_check(self) -> None:
+        """Test known-valid results are returned without another check."""
+        data = {"nested": [{"a": 1}]}
+        with patch(
+            "SimpleLLMFunc.base.tool_call.validation._is_json_serializable"
+        ) as check:
+            result = serialize_tool_output_for_langfuse(data, known_valid=True)
+
+        assert result is data
+        check.assert_not_called()
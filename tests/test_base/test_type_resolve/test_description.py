@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Dict, List, Literal, Optional
+from unittest.mock import patch
 
 import pytest
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, conint
 
 from SimpleLLMFunc.base.type_resolve.description import (
     build_type_description_xml,
@@ -108,6 +111,58 @@ class TestDescribePydanticModel:
         result = describe_pydantic_model(ConstrainedModel)
         assert "ConstrainedModel" in result
 
+    def test_field_info_constraints_and_defaults(self) -> None:
+        """Test describing a model from field info without building a schema."""
+
+        class FieldModel(BaseModel):
+            age: int = Field(ge=0, le=150, description="年龄")
+            email: Optional[str] = None
+
+        with patch.object(FieldModel, "model_json_schema") as schema:
+            result = describe_pydantic_model(FieldModel)
+
+        schema.assert_not_called()
+        assert "age (integer, 必填): 年龄, 最小值: 0, 最大值: 150" in result
+        assert "email (string, 可选): , 默认值: None" in result
+
+    def test_aliased_fields_use_alias(self) -> None:
+        """Test aliased fields are described by the key validation accepts."""
+
+        class AliasModel(BaseModel):
+            user_name: str = Field(alias="userName", description="用户名")
+
+        result = describe_pydantic_model(AliasModel)
+        assert "userName (string, 必填): 用户名" in result
+        assert "user_name" not in result
+
+    def test_non_primitive_fields_use_schema_type(self) -> None:
+        """Test Literal, Enum and datetime fields report their JSON type."""
+
+        class Color(Enum):
+            RED = "r"
+
+        class SchemaTypeModel(BaseModel):
+            mode: Literal["a", "b"]
+            created: datetime
+            color: Color = Color.RED
+
+        result = describe_pydantic_model(SchemaTypeModel)
+        assert "mode (string, 必填)" in result
+        assert "created (string, 必填)" in result
+        assert "color (string, 可选): , 默认值: r" in result
+        assert "unknown" not in result
+
+    def test_interval_bounds(self) -> None:
+        """Test conint bounds stored as a single Interval are described."""
+
+        class IntervalModel(BaseModel):
+            rating: conint(ge=1, le=5)  # type: ignore[valid-type]
+            ratio: float = Field(gt=0, lt=1)
+
+        result = describe_pydantic_model(IntervalModel)
+        assert "rating (integer, 必填): , 最小值: 1, 最大值: 5" in result
+        assert "ratio (number, 必填): , 大于: 0, 小于: 1" in result
+
 
 class TestBuildTypeDescriptionXml:
     """Tests for build_type_description_xml function."""
@@ -221,3 +276,32 @@ class TestGenerateExampleXml:
         assert result.startswith("<")
         assert "OptionalModel" in result
 
+
+class TestTypeDescriptionCaching:
+    """Tests for per-type caching of generated descriptions."""
+
+    def test_model_description_is_cached(self) -> None:
+        """Repeated descriptions of a model reuse the cached result."""
+
+        class CachedModel(BaseModel):
+            name: str
+
+        first = get_detailed_type_description(List[CachedModel])
+        assert get_detailed_type_description(List[CachedModel]) is first
+
+    def test_top_level_xml_calls_are_cached(self) -> None:
+        """Top-level XML schema and example calls return the cached strings."""
+
+        class XmlModel(BaseModel):
+            items: List[str]
+
+        assert build_type_description_xml(XmlModel) is build_type_description_xml(
+            XmlModel
+        )
+        assert generate_example_xml(XmlModel) is generate_example_xml(XmlModel)
+
+    def test_unhashable_type_hint_is_not_cached(self) -> None:
+        """Unhashable type hints fall back to direct generation."""
+        type_hint = Annotated[int, {"unit": "s"}]
+
+        assert get_detailed_type_description(type_hint) == str(type_hint)
@@ -120,6 +120,12 @@ class TestHasMultimodalContent:
         type_hints = {"contents": List[Text]}
         assert has_multimodal_content(arguments, type_hints) is True
 
+    def test_type_hint_without_argument(self) -> None:
+        """Test annotated parameters that were not passed are ignored."""
+        arguments = {"number": 1}
+        type_hints = {"image": ImgUrl, "number": int, "return": str}
+        assert has_multimodal_content(arguments, type_hints) is False
+
     def test_empty_arguments(self) -> None:
         """Test empty arguments."""
         assert has_multimodal_content({}, {}) is False
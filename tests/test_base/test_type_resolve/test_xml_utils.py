@@ -77,6 +77,40 @@ class TestGenerateXmlExample:
         result_int = generate_xml_example(int)
         assert "123" in result_int
 
+    def test_optional_primitive_fields(self) -> None:
+        """Test Optional primitive fields use the inner type's example."""
+
+        class OptionalModel(BaseModel):
+            count: Optional[int]
+            flag: Union[bool, None]
+
+        result = generate_xml_example(OptionalModel)
+        assert "<count>123</count>" in result
+        assert "<flag>true</flag>" in result
+
+    def test_pep604_optional_fields(self) -> None:
+        """Test X | None annotations are unwrapped like Optional[X]."""
+
+        class Pep604Model(BaseModel):
+            count: int | None
+            tags: list[str] | None
+
+        result = generate_xml_example(Pep604Model)
+        assert "<count>123</count>" in result
+        assert "<item>example</item>" in result
+
+    def test_required_fields_use_examples_and_defaults_are_kept(self) -> None:
+        """Test required fields get example values while defaults are reused."""
+
+        class DefaultModel(BaseModel):
+            name: str
+            retries: int = 3
+
+        result = generate_xml_example(DefaultModel)
+        assert "<name>example</name>" in result
+        assert "<retries>3</retries>" in result
+        assert "PydanticUndefined" not in result
+
 
 class TestXmlToDict:
     """Tests for xml_to_dict function."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, get_type_hints
 from unittest.mock import patch
 
 import pytest
@@ -70,6 +70,22 @@ class TestExtractFunctionMetadata:
         assert func_name == "test_func"
         assert docstring == ""
 
+    def test_extract_metadata_is_cached_per_function(self) -> None:
+        """Test metadata is computed once per function."""
+
+        def test_func(param: str) -> str:
+            return "result"
+
+        with patch(
+            "SimpleLLMFunc.llm_decorator.steps.common.signature.get_type_hints",
+            wraps=get_type_hints,
+        ) as mock_get_type_hints:
+            first = extract_function_metadata(test_func)
+            second = extract_function_metadata(test_func)
+
+        assert first is second
+        assert mock_get_type_hints.call_count == 1
+
 
 class TestGenerateTraceId:
     """Tests for generate_trace_id function."""
@@ -156,6 +156,22 @@ def test_llm_function_default_max_tool_calls_is_none() -> None:
     assert signature.parameters["max_tool_calls"].default is None
 
 
+def test_llm_function_wrapper_preserves_function_metadata() -> None:
+    """The decorated function should expose the original function's metadata."""
+
+    async def summarize(text: str) -> str:
+        """Summarize the text."""
+        return ""
+
+    decorated = llm_function(llm_interface=MagicMock())(summarize)
+
+    assert decorated.__wrapped__ is summarize
+    assert decorated.__name__ == "summarize"
+    assert decorated.__qualname__ == summarize.__qualname__
+    assert decorated.__doc__ == "Summarize the text."
+    assert list(inspect.signature(decorated).parameters) == ["text"]
+
+
 @pytest.mark.asyncio
 async def test_llm_function_passes_none_max_tool_calls_to_execute_react_loop() -> None:
     """llm_function should forward the unbounded default into ReAct orchestration."""
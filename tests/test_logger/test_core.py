@@ -0,0 +1,177 @@
+"""Tests for logger.core module."""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from SimpleLLMFunc.logger.context_manager import log_context
+from SimpleLLMFunc.logger.core import (
+    _EMPTY_EXTRA,
+    app_log,
+    get_logger,
+    is_debug_enabled,
+    is_info_enabled,
+    push_debug,
+    push_error,
+    push_info,
+)
+from SimpleLLMFunc.logger.types import LogLevel
+from SimpleLLMFunc.logger.utils import LocationFilter
+
+
+class _RecordCollector(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.records: List[logging.LogRecord] = []
+        self.addFilter(LocationFilter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def collector() -> Iterator[_RecordCollector]:
+    handler = _RecordCollector()
+    logger = get_logger()
+    logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        logger.removeHandler(handler)
+
+
+class TestLocation:
+    """Tests for caller location resolution."""
+
+    def test_push_helpers_point_to_caller(self, collector: _RecordCollector) -> None:
+        push_debug("debug message")
+        push_info("info message")
+        app_log("app message")
+
+        assert [r.funcName for r in collector.records] == [
+            "test_push_helpers_point_to_caller"
+        ] * 3
+        for record in collector.records:
+            assert record.filename == "test_core.py"
+            assert record.location == (
+                f"test_core.py:test_push_helpers_point_to_caller:{record.lineno}"
+            )
+
+    def test_explicit_location_is_preserved(
+        self, collector: _RecordCollector
+    ) -> None:
+        push_info("info message", location="custom.py:func:1")
+
+        assert collector.records[-1].location == "custom.py:func:1"
+
+    def test_exc_info_captures_active_exception(
+        self, collector: _RecordCollector
+    ) -> None:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            push_error("failed", exc_info=True)
+
+        record = collector.records[-1]
+        assert record.exc_info is not None
+        assert record.exc_info[0] is ValueError
+        assert record.funcName == "test_exc_info_captures_active_exception"
+
+    def test_disabled_level_builds_no_record(self) -> None:
+        logger = get_logger()
+        original_level = logger.level
+        try:
+            logger.setLevel(logging.INFO)
+            with patch.object(logger, "makeRecord") as make_record:
+                push_debug("dropped")
+        finally:
+            logger.setLevel(original_level)
+
+        make_record.assert_not_called()
+
+    def test_filter_skipped_for_rejected_level(self) -> None:
+        handler = _RecordCollector()
+        handler.setLevel(logging.ERROR)
+        calls: List[logging.LogRecord] = []
+        handler.addFilter(lambda record: calls.append(record) or True)
+        logger = get_logger()
+        logger.addHandler(handler)
+        try:
+            push_debug("filtered out")
+        finally:
+            logger.removeHandler(handler)
+
+        assert calls == []
+        assert handler.records == []
+
+
+class TestExtraFields:
+    """Tests for context and extra field merging."""
+
+    def test_context_and_kwargs_are_merged(
+        self, collector: _RecordCollector
+    ) -> None:
+        with log_context(trace_id="ctx", user_id="u1"):
+            push_info("with context", trace_id="call", step=2)
+
+        record = collector.records[-1]
+        assert record.trace_id == "ctx_call"
+        assert record.user_id == "u1"
+        assert record.step == 2
+
+    def test_shared_empty_extra_is_not_mutated(
+        self, collector: _RecordCollector
+    ) -> None:
+        push_info("first")
+        push_info("second")
+
+        assert _EMPTY_EXTRA == {"trace_id": "", "location": None}
+        assert all(record.trace_id == "" for record in collector.records)
+
+
+class TestIsDebugEnabled:
+    """Tests for is_debug_enabled function."""
+
+    def test_follows_logger_level(self) -> None:
+        logger = get_logger()
+        original_level = logger.level
+        try:
+            logger.setLevel(logging.INFO)
+            assert is_debug_enabled() is False
+            logger.setLevel(logging.DEBUG)
+            assert is_debug_enabled() is True
+        finally:
+            logger.setLevel(original_level)
+
+
+class TestIsInfoEnabled:
+    """Tests for is_info_enabled function."""
+
+    def test_follows_logger_level(self) -> None:
+        logger = get_logger()
+        original_level = logger.level
+        try:
+            logger.setLevel(logging.WARNING)
+            assert is_info_enabled() is False
+            logger.setLevel(logging.INFO)
+            assert is_info_enabled() is True
+        finally:
+            logger.setLevel(original_level)
+
+
+class TestLogLevel:
+    """LogLevel values mirror the stdlib logging levels."""
+
+    def test_values_match_logging(self) -> None:
+        for level in LogLevel:
+            assert level == getattr(logging, level.name)
+
+    def test_handler_accepts_log_level_directly(self) -> None:
+        handler = logging.Handler()
+        handler.setLevel(LogLevel.WARNING)
+
+        assert handler.level == logging.WARNING
@@ -0,0 +1,71 @@
+"""Tests for logger.formatters module."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+from SimpleLLMFunc.logger.formatters import ConsoleFormatter
+
+
+def _make_record(**extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "hello", None, None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class TestConsoleFormatter:
+    """Tests for ConsoleFormatter class."""
+
+    def test_appends_present_extra_info_only(self) -> None:
+        formatter = ConsoleFormatter(use_color=False, format_string="%(message)s")
+        record = _make_record(trace_id="trace_1", location="", input_tokens=3)
+
+        formatted = formatter.format(record)
+
+        assert formatted == "\n".join(
+            ["=" * 30, "hello", "trace_id=trace_1", "input_tokens=3", "=" * 30]
+        )
+
+    def test_without_extra_info(self) -> None:
+        formatter = ConsoleFormatter(use_color=False, format_string="%(message)s")
+
+        assert formatter.format(_make_record()) == "\n".join(
+            ["=" * 30, "hello", "=" * 30]
+        )
+
+    def test_colored_output_wraps_message_only(self) -> None:
+        with patch("sys.stdout.isatty", return_value=True):
+            formatter = ConsoleFormatter(use_color=True, format_string="%(message)s")
+        record = _make_record(trace_id="trace_1")
+
+        assert formatter.format(record) == "\n".join(
+            ["=" * 30, "\033[32mhello\033[0m", "trace_id=trace_1", "=" * 30]
+        )
+
+    def test_unknown_level_falls_back_to_reset_color(self) -> None:
+        with patch("sys.stdout.isatty", return_value=True):
+            formatter = ConsoleFormatter(use_color=True, format_string="%(message)s")
+        record = _make_record()
+        record.levelname = "CUSTOM"
+
+        assert formatter.format(record) == "\n".join(
+            ["=" * 30, "\033[0mhello\033[0m", "=" * 30]
+        )
+
+    def test_format_time_matches_stdlib_and_reuses_second(self) -> None:
+        formatter = ConsoleFormatter(use_color=False)
+        reference = logging.Formatter()
+        first = _make_record()
+        first.created, first.msecs = 1_700_000_000.123, 123.0
+        second = _make_record()
+        second.created, second.msecs = 1_700_000_000.987, 987.0
+
+        expected_second = reference.formatTime(second)
+
+        assert formatter.formatTime(first) == reference.formatTime(first)
+        with patch("time.strftime") as strftime:
+            assert formatter.formatTime(second) == expected_second
+        strftime.assert_not_called()
@@ -0,0 +1,89 @@
+"""Tests for logger.handlers module."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import time
+from typing import List
+
+from SimpleLLMFunc.logger.handlers import (
+    InProcessQueueHandler,
+    PeriodicFlushMemoryHandler,
+)
+
+
+class _RecordCollector(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _make_record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestInProcessQueueHandler:
+    """Tests for InProcessQueueHandler class."""
+
+    def test_prepare_merges_args_and_keeps_exc_info(self) -> None:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = InProcessQueueHandler(log_queue)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        payload = {"key": "before"}
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "value=%s", (payload,), exc_info
+        )
+
+        handler.handle(record)
+        payload["key"] = "after"
+        queued = log_queue.get_nowait()
+
+        assert queued is not record
+        assert queued.getMessage() == "value={'key': 'before'}"
+        assert queued.args is None
+        assert queued.exc_info is exc_info
+
+
+class TestPeriodicFlushMemoryHandler:
+    """Tests for PeriodicFlushMemoryHandler class."""
+
+    def test_buffers_until_error(self) -> None:
+        target = _RecordCollector()
+        handler = PeriodicFlushMemoryHandler(10, target, flush_interval=60)
+        try:
+            handler.handle(_make_record(logging.INFO, "info"))
+            assert target.records == []
+
+            handler.handle(_make_record(logging.ERROR, "error"))
+            assert [r.msg for r in target.records] == ["info", "error"]
+        finally:
+            handler.close()
+
+    def test_flushes_periodically(self) -> None:
+        target = _RecordCollector()
+        handler = PeriodicFlushMemoryHandler(10, target, flush_interval=0.01)
+        try:
+            handler.handle(_make_record(logging.DEBUG, "debug"))
+            deadline = time.monotonic() + 2
+            while not target.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert [r.msg for r in target.records] == ["debug"]
+        finally:
+            handler.close()
+
+    def test_close_flushes_remaining_records(self) -> None:
+        target = _RecordCollector()
+        handler = PeriodicFlushMemoryHandler(10, target, flush_interval=60)
+        handler.handle(_make_record(logging.INFO, "info"))
+
+        handler.close()
+
+        assert [r.msg for r in target.records] == ["info"]
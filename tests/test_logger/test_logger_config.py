@@ -0,0 +1,42 @@
+"""Tests for logger.logger_config module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from SimpleLLMFunc.logger.logger_config import LoggerConfig, get_logger_config
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    monkeypatch.delenv("LOG_DIR", raising=False)
+    get_logger_config.cache_clear()
+    yield
+    get_logger_config.cache_clear()
+
+
+class TestGetLoggerConfig:
+    """Tests for get_logger_config function."""
+
+    def test_defaults_without_config_source(self) -> None:
+        config = get_logger_config()
+
+        assert isinstance(config, LoggerConfig)
+        assert config.LOG_LEVEL == "DEBUG"
+        assert config.LOG_DIR == "logs"
+
+    def test_reads_environment_variables(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("log_level", "WARNING")
+
+        assert get_logger_config().LOG_LEVEL == "WARNING"
+
+    def test_reads_env_file(self, tmp_path: Path) -> None:
+        (tmp_path / ".env").write_text("LOG_DIR=custom_logs\n", encoding="utf-8")
+
+        assert get_logger_config().LOG_DIR == "custom_logs"
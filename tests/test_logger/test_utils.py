@@ -0,0 +1,33 @@
+"""Tests for logger.utils module."""
+
+from __future__ import annotations
+
+from SimpleLLMFunc.logger import utils
+from SimpleLLMFunc.logger.utils import get_location
+
+
+def _caller() -> str:
+    return get_location()
+
+
+class TestGetLocation:
+    def test_points_to_caller_of_caller(self) -> None:
+        location = _caller()
+        filename, function, lineno = location.split(":")
+
+        assert filename == "test_utils.py"
+        assert function == "test_points_to_caller_of_caller"
+        assert int(lineno) > 0
+
+    def test_depth_one_is_current_function(self) -> None:
+        assert get_location(1).startswith("test_utils.py:test_depth_one_is_current_function:")
+
+    def test_result_is_cached_per_call_site(self) -> None:
+        utils._format_location.cache_clear()
+        first = [_caller() for _ in range(3)]
+
+        assert len(set(first)) == 1
+        assert utils._format_location.cache_info().currsize == 1
+
+    def test_too_deep_returns_unknown(self) -> None:
+        assert get_location(10_000) == "unknown"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from SimpleLLMFunc.tool import Tool
+
+
+async def _search(query: str, limit: int = 5) -> str:
+    """Search documents.
+
+    Args:
+        query: Search keywords
+        limit: Maximum number of results
+    """
+    return query
+
+
+def test_to_openai_tool_reuses_cached_schema() -> None:
+    search_tool = Tool(name="search", description="Search docs", func=_search)
+
+    first = search_tool.to_openai_tool()
+
+    assert search_tool.to_openai_tool() is first
+    assert first["function"]["name"] == "search"
+    assert first["function"]["parameters"]["required"] == ["query"]
+
+
+def test_to_openai_tool_refreshes_after_metadata_change() -> None:
+    search_tool = Tool(name="search", description="Search docs", func=_search)
+    first = search_tool.to_openai_tool()
+
+    search_tool.description = "Search the knowledge base"
+    second = search_tool.to_openai_tool()
+
+    assert second is not first
+    assert second["function"]["description"] == "Search the knowledge base"
+    assert Tool.serialize_tools([search_tool]) == [second]
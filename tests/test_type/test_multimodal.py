@@ -0,0 +1,82 @@
+"""Tests for type.multimodal module."""
+
+from __future__ import annotations
+
+import base64
+import os
+from pathlib import Path
+
+import pytest
+
+from SimpleLLMFunc.type import multimodal
+from SimpleLLMFunc.type.multimodal import ImgPath, _encode_file_base64
+
+
+class TestImgPathToBase64:
+    """Tests for ImgPath.to_base64."""
+
+    def test_encodes_file_contents(self, tmp_path: Path) -> None:
+        image = tmp_path / "a.png"
+        image.write_bytes(b"fake image data")
+
+        assert ImgPath(image).to_base64() == base64.b64encode(
+            b"fake image data"
+        ).decode("utf-8")
+
+    def test_reuses_encoding_for_unchanged_file(self, tmp_path: Path) -> None:
+        image = tmp_path / "b.png"
+        image.write_bytes(b"first")
+        _encode_file_base64.cache_clear()
+
+        ImgPath(image).to_base64()
+        ImgPath(image).to_base64()
+
+        info = _encode_file_base64.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_modified_file_is_re_encoded(self, tmp_path: Path) -> None:
+        image = tmp_path / "c.png"
+        image.write_bytes(b"first")
+        img = ImgPath(image)
+        img.to_base64()
+
+        image.write_bytes(b"second version")
+        stat = image.stat()
+        os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert img.to_base64() == base64.b64encode(b"second version").decode("utf-8")
+
+    def test_large_file_bypasses_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        image = tmp_path / "d.png"
+        image.write_bytes(b"larger than the limit")
+        monkeypatch.setattr(multimodal, "_BASE64_CACHE_MAX_FILE_SIZE", 4)
+        _encode_file_base64.cache_clear()
+
+        encoded = ImgPath(image).to_base64()
+
+        assert encoded == base64.b64encode(b"larger than the limit").decode("utf-8")
+        assert _encode_file_base64.cache_info().currsize == 0
+
+
+class TestImgPathToDataUrl:
+    """Tests for ImgPath.to_data_url."""
+
+    def test_builds_data_url(self, tmp_path: Path) -> None:
+        image = tmp_path / "a.jpg"
+        image.write_bytes(b"fake image data")
+
+        expected = base64.b64encode(b"fake image data").decode("ascii")
+        assert ImgPath(image).to_data_url() == f"data:image/jpeg;base64,{expected}"
+
+    def test_shares_base64_cache_with_to_base64(self, tmp_path: Path) -> None:
+        image = tmp_path / "b.png"
+        image.write_bytes(b"first")
+        _encode_file_base64.cache_clear()
+
+        ImgPath(image).to_base64()
+        ImgPath(image).to_data_url()
+
+        info = _encode_file_base64.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
@@ -0,0 +1,90 @@
+"""Tests for utils.json_utils module."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from SimpleLLMFunc.utils import json_utils
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_round_trips_non_ascii(self) -> None:
+        payload = {"text": "你好", "items": [1, 2.5, None, True]}
+
+        assert json.loads(json_utils.dumps(payload)) == payload
+        assert "你好" in json_utils.dumps(payload)
+
+    def test_indent(self) -> None:
+        assert json_utils.dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+    def test_compact_by_default(self) -> None:
+        assert json_utils.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_fallback_is_compact(self) -> None:
+        assert json_utils.dumps({"a": 2**70}) == '{"a":%d}' % 2**70
+
+    def test_non_str_keys(self) -> None:
+        assert json.loads(json_utils.dumps({1: "a"})) == {"1": "a"}
+
+    def test_falls_back_for_big_int(self) -> None:
+        assert json_utils.dumps(2**70) == str(2**70)
+
+    def test_default(self) -> None:
+        class Custom:
+            def __str__(self) -> str:
+                return "custom"
+
+        assert json.loads(json_utils.dumps({"v": Custom()}, default=str)) == {
+            "v": "custom"
+        }
+
+    def test_dataclass_and_datetime_need_default(self) -> None:
+        @dataclass
+        class Point:
+            x: int
+
+        for value in (Point(1), datetime(2024, 1, 1)):
+            with pytest.raises(TypeError):
+                json_utils.dumps(value)
+            assert json_utils.dumps(value, default=str) == json.dumps(
+                value, default=str
+            )
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+    def test_non_finite_floats_match_stdlib(self, value: float) -> None:
+        payload = {"v": [value, None]}
+
+        assert json_utils.dumps(payload) == json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":")
+        )
+
+    def test_non_finite_float_from_default_matches_stdlib(self) -> None:
+        class Reading:
+            pass
+
+        assert json_utils.dumps([Reading()], default=lambda _: float("nan")) == "[NaN]"
+
+    def test_unserializable_raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+            json_utils.dumps({"v": object()})
+
+
+class TestLoads:
+    """Tests for loads function."""
+
+    def test_loads(self) -> None:
+        assert json_utils.loads('{"a": [1, "二"]}') == {"a": [1, "二"]}
+
+    def test_invalid_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("{bad")
+
+    def test_accepts_nan(self) -> None:
+        value = json_utils.loads("[NaN]")[0]
+        assert value != value